@@ -1,11 +1,38 @@
 import sys
-import requests
+import argparse
+import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                               QHBoxLayout, QLabel, QFrame, QGridLayout)
-from PyQt5.QtCore import QTimer, Qt
+                               QHBoxLayout, QLabel, QFrame, QGridLayout, QScrollBar, QListWidget)
+from PyQt5.QtCore import QTimer, Qt, QObject, QThread, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QFont
 import pyqtgraph as pg
 from datetime import datetime
+from borsa_veri import DEFAULT_CURRENCIES, RESOLUTIONS, pick_resolution, decimate_minmax
+from borsa_istemci import RateClient, PollScheduler, API_URL, CACHE_PATH
+from borsa_depo import TickStore, HISTORY_DIR
+from borsa_toplayici import RateCollector, TREND_ARROWS
+from borsa_alarm import AlertEngine
+
+CURRENCY_COLORS = {'USD': '#2196F3', 'EUR': '#4CAF50', 'GBP': '#9C27B0'}
+
+# Mum çözünürlüğü seçilirken nokta başına düşen yatay piksel
+PIXELS_PER_POINT = 3
+
+# Alarm listesinde tutulacak en fazla satır
+ALERT_LIST_SIZE = 200
+
+# Bir eğride bundan fazla nokta çizildiğinde semboller gizlenir
+SYMBOL_LIMIT = 200
+
+TREND_NAMES = {1: 'up', -1: 'down', 0: 'flat'}
+
+
+def set_text(label, text):
+    # Metin değişmediyse setText (ve beraberindeki yeniden yerleşim/çizim) atlanır
+    if label.property('shownText') != text:
+        label.setProperty('shownText', text)
+        label.setText(text)
+
 
 class StylishLabel(QLabel):
     def __init__(self, text=''):
@@ -20,7 +47,7 @@ class StylishLabel(QLabel):
         """)
 
 class CurrencyWidget(QFrame):
-    def __init__(self, currency):
+    def __init__(self, currency=''):
         super().__init__()
         self.setFrameStyle(QFrame.StyledPanel | QFrame.Raised)
         self.setStyleSheet("""
@@ -33,30 +60,184 @@ class CurrencyWidget(QFrame):
         
         layout = QGridLayout(self)
         
-        title = QLabel(f"{currency}")
-        title.setFont(QFont("Arial", 12, QFont.Bold))
-        title.setStyleSheet("color: #2c3e50;")
+        self.title = QLabel(f"{currency}")
+        self.title.setFont(QFont("Arial", 12, QFont.Bold))
+        self.title.setStyleSheet("color: #2c3e50;")
         
         self.value_label = StylishLabel('0.00')
         self.value_label.setFont(QFont("Arial", 11))
         self.value_label.setAlignment(Qt.AlignRight)
         
+        # Trend rengi stil sayfası değiştirilmeden, dinamik özellikle seçilir
         self.trend_label = QLabel('➡')
         self.trend_label.setFont(QFont("Arial", 14))
+        self.trend_label.setProperty('trend', 'flat')
+        self.trend_label.setStyleSheet("""
+            QLabel { color: #2c3e50; }
+            QLabel[trend="up"] { color: #2ecc71; }
+            QLabel[trend="down"] { color: #e74c3c; }
+        """)
         
         self.high_label = StylishLabel('En Yüksek: 0.00')
         self.low_label = StylishLabel('En Düşük: 0.00')
         self.avg_label = StylishLabel('Ortalama: 0.00')
+        self.ewma_label = StylishLabel('EWMA: 0.00')
+        self.volatility_label = StylishLabel('Std. Sapma: 0.0000 | Oynaklık: %0.000 | Z: 0.00')
         
-        layout.addWidget(title, 0, 0)
+        layout.addWidget(self.title, 0, 0)
         layout.addWidget(self.value_label, 0, 1)
         layout.addWidget(self.trend_label, 0, 2)
         layout.addWidget(self.high_label, 1, 0, 1, 3)
         layout.addWidget(self.low_label, 2, 0, 1, 3)
         layout.addWidget(self.avg_label, 3, 0, 1, 3)
+        layout.addWidget(self.ewma_label, 4, 0, 1, 3)
+        layout.addWidget(self.volatility_label, 5, 0, 1, 3)
+
+    def set_currency(self, currency):
+        set_text(self.title, currency)
+
+    def set_trend(self, trend):
+        set_text(self.trend_label, TREND_ARROWS[trend])
+        name = TREND_NAMES[trend]
+        if self.trend_label.property('trend') != name:
+            self.trend_label.setProperty('trend', name)
+            # Yalnızca bu etiket yeniden stillendirilir
+            self.trend_label.style().unpolish(self.trend_label)
+            self.trend_label.style().polish(self.trend_label)
+
+    def show_series(self, series):
+        if not len(series):
+            set_text(self.value_label, '0.00')
+            set_text(self.high_label, 'En Yüksek: 0.00')
+            set_text(self.low_label, 'En Düşük: 0.00')
+            set_text(self.avg_label, 'Ortalama: 0.00')
+            set_text(self.ewma_label, 'EWMA: 0.00')
+            set_text(self.volatility_label, 'Std. Sapma: 0.0000 | Oynaklık: %0.000 | Z: 0.00')
+            self.set_trend(0)
+            return
+
+        set_text(self.value_label, f'{series.latest():.2f} TRY')  # Display in TRY
+        set_text(self.high_label, f'En Yüksek: {series.high:.2f} TRY')
+        set_text(self.low_label, f'En Düşük: {series.low:.2f} TRY')
+        set_text(self.avg_label, f'Ortalama: {series.average:.2f} TRY')
+        stats = series.stats
+        set_text(self.ewma_label, f'EWMA: {stats.ewma:.2f} TRY')
+        set_text(self.volatility_label,
+                 f'Std. Sapma: {stats.std:.4f} | Oynaklık: %{stats.realized_volatility:.3f} | '
+                 f'Z: {stats.zscore(series.latest()):.2f}')
+        self.set_trend(series.trend)
+
+class CurrencyBoard(QWidget):
+    """Yalnızca görünen satırlar kadar CurrencyWidget tutan sanal liste.
+
+    Kaydırıldıkça aynı widget'lar farklı dövizlere yeniden bağlanır, böylece
+    yüzlerce döviz izlense de tick başına sadece görünen kartlar güncellenir.
+    """
+    visible_changed = pyqtSignal()
+
+    def __init__(self, currency_data):
+        super().__init__()
+        self.currency_data = currency_data
+        self.currencies = list(currency_data.keys())
+        self.widgets = []
+        self.row_height = None
+        
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.rows = QWidget()
+        self.rows_layout = QVBoxLayout(self.rows)
+        self.rows_layout.setContentsMargins(0, 0, 0, 0)
+        self.rows_layout.setSpacing(20)
+        self.rows_layout.addStretch()
+        layout.addWidget(self.rows, 1)
+        
+        self.scroll_bar = QScrollBar(Qt.Vertical)
+        self.scroll_bar.valueChanged.connect(self.rebind)
+        layout.addWidget(self.scroll_bar)
+
+    def visible_currencies(self):
+        start = self.scroll_bar.value()
+        return self.currencies[start:start + len(self.widgets)]
+
+    def ensure_rows(self):
+        # Widget'lar ilk ihtiyaç duyulduğunda, yalnızca sığacak kadar oluşturulur
+        if self.row_height is None:
+            probe = CurrencyWidget()
+            self.row_height = probe.sizeHint().height() + self.rows_layout.spacing()
+            probe.deleteLater()
+        capacity = max(1, (self.height() + self.rows_layout.spacing()) // self.row_height)
+        count = min(capacity, len(self.currencies))
+        while len(self.widgets) < count:
+            widget = CurrencyWidget()
+            self.rows_layout.insertWidget(len(self.widgets), widget)
+            self.widgets.append(widget)
+        while len(self.widgets) > count:
+            self.widgets.pop().deleteLater()
+        
+        self.scroll_bar.setRange(0, max(0, len(self.currencies) - len(self.widgets)))
+        self.scroll_bar.setPageStep(max(1, len(self.widgets)))
+        self.scroll_bar.setVisible(self.scroll_bar.maximum() > 0)
+        self.rebind()
+
+    def rebind(self):
+        for widget, currency in zip(self.widgets, self.visible_currencies()):
+            widget.set_currency(currency)
+            widget.show_series(self.currency_data[currency])
+        self.visible_changed.emit()
+
+    def refresh(self):
+        # Kartlardaki tüm değişiklikler tek bir yeniden çizimde toplanır
+        self.setUpdatesEnabled(False)
+        for widget, currency in zip(self.widgets, self.visible_currencies()):
+            widget.show_series(self.currency_data[currency])
+        self.setUpdatesEnabled(True)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.ensure_rows()
+
+    def wheelEvent(self, event):
+        steps = round(-event.angleDelta().y() / 120)
+        self.scroll_bar.setValue(self.scroll_bar.value() + steps)
+
+class RateFetchWorker(QObject):
+    """Kur isteklerini GUI thread'i dışında yapan çalışan."""
+    fetched = pyqtSignal(object, object, object)
+    failed = pyqtSignal(str, object)
+
+    def __init__(self, url=API_URL, cache_path=CACHE_PATH):
+        super().__init__()
+        self.url = url
+        self.cache_path = cache_path
+        self.client = None
+
+    @pyqtSlot()
+    def fetch(self):
+        # Oturum, kullanılacağı thread içinde oluşturulur
+        if self.client is None:
+            self.client = RateClient(self.url, cache_path=self.cache_path)
+        try:
+            data = self.client.fetch()
+            info = {
+                'cache': dict(self.client.stats),
+                'changed': self.client.changed,
+                'headers': self.client.last_headers,
+            }
+            self.fetched.emit(data, datetime.now(), info)
+        except Exception as e:
+            response = getattr(e, 'response', None)
+            self.failed.emit(str(e), dict(response.headers) if response is not None else {})
+
+    def close(self):
+        if self.client is not None:
+            self.client.close()
+
 
 class BorsaTakip(QMainWindow):
-    def __init__(self):
+    fetch_requested = pyqtSignal()
+
+    def __init__(self, currencies=None, url=API_URL, history_dir=HISTORY_DIR, cache_path=CACHE_PATH,
+                 alert_engine=None):
         super().__init__()
         self.setWindowTitle("Borsa Takip")
         self.setGeometry(100, 100, 1200, 800)
@@ -70,17 +251,14 @@ class BorsaTakip(QMainWindow):
         self.left_layout = QVBoxLayout(self.left_panel)
         self.left_layout.setSpacing(20)
         
-        self.currency_widgets = {}
-        self.currency_data = {
-            'USD': {'values': [], 'times': [], 'last_value': 0},
-            'EUR': {'values': [], 'times': [], 'last_value': 0},
-            'GBP': {'values': [], 'times': [], 'last_value': 0},
-        }
+        # Veri ve istatistikler arayüzden bağımsız toplayıcıda tutulur
+        self.collector = RateCollector(currencies, store=TickStore(history_dir),
+                                       alert_engine=alert_engine)
+        self.currencies = self.collector.currencies
+        self.currency_data = self.collector.currency_data
         
-        for currency in self.currency_data.keys():
-            widget = CurrencyWidget(currency)
-            self.currency_widgets[currency] = widget
-            self.left_layout.addWidget(widget)
+        self.board = CurrencyBoard(self.currency_data)
+        self.left_layout.addWidget(self.board, 1)
 
         # Güncel tarihi göstermek için QLabel ekleyin
         self.date_label = QLabel()
@@ -90,9 +268,14 @@ class BorsaTakip(QMainWindow):
         self.right_panel = QWidget()
         self.right_layout = QVBoxLayout(self.right_panel)
         
-        self.graph_widget = pg.PlotWidget()
+        self.graph_widget = pg.PlotWidget(axisItems={'bottom': pg.DateAxisItem()})
+        self.curves = {}
+        self.curve_symbols = {}
+        self.resolution = None
+        self.auto_range = True
         self.setup_graph()
         self.right_layout.addWidget(self.graph_widget)
+        self.board.visible_changed.connect(self.schedule_frame)
         
         self.stats_panel = QFrame()
         self.stats_panel.setStyleSheet("""
@@ -109,76 +292,116 @@ class BorsaTakip(QMainWindow):
         self.current_stats.setStyleSheet("font-size: 12px; color: #2c3e50;")
         self.stats_layout.addWidget(self.current_stats)
         
+        self.cache_stats = QLabel()
+        self.cache_stats.setStyleSheet("font-size: 12px; color: #7f8c8d;")
+        self.cache_stats.setAlignment(Qt.AlignRight | Qt.AlignTop)
+        self.stats_layout.addWidget(self.cache_stats)
+        
         self.right_layout.addWidget(self.stats_panel)
         
+        self.alert_list = QListWidget()
+        self.alert_list.setMaximumHeight(120)
+        self.alert_list.setStyleSheet("""
+            QListWidget {
+                background-color: white;
+                border-radius: 10px;
+                border: 1px solid #ddd;
+                color: #c0392b;
+                font-size: 12px;
+            }
+        """)
+        self.alert_list.setVisible(alert_engine is not None and len(alert_engine) > 0)
+        self.right_layout.addWidget(self.alert_list)
+        
         self.layout.addWidget(self.left_panel, 1)
         self.layout.addWidget(self.right_panel, 2)
         
+        self.last_update = None
+        self.frame_timer = QTimer()
+        self.frame_timer.setSingleShot(True)
+        self.frame_timer.setInterval(16)
+        self.frame_timer.timeout.connect(self.render_frame)
+        
+        # Ağ istekleri ayrı bir thread'de çalışır, sonuçlar sinyallerle gelir
+        self.fetch_in_flight = False
+        self.fetch_thread = QThread(self)
+        self.fetch_worker = RateFetchWorker(url, cache_path)
+        self.fetch_worker.moveToThread(self.fetch_thread)
+        self.fetch_requested.connect(self.fetch_worker.fetch)
+        self.fetch_worker.fetched.connect(self.on_rates_fetched)
+        self.fetch_worker.failed.connect(self.on_fetch_failed)
+        self.fetch_thread.start()
+        
+        # Bir sonraki sorgu, önceki yanıta göre zamanlayıcının seçtiği aralıkla yapılır
+        self.poll_scheduler = PollScheduler()
         self.timer = QTimer()
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.update_data)
-        self.timer.start(1000)  # Update every 1 second
         
         self.active_currency = 'USD'
         self.update_data()
 
     def update_data(self):
+        # Önceki istek hâlâ sürüyorsa bu tick atlanır
+        if self.fetch_in_flight:
+            return
+        self.fetch_in_flight = True
+        self.fetch_requested.emit()
+
+    def schedule_poll(self, delay):
+        self.timer.start(int(delay * 1000))
+
+    def on_fetch_failed(self, message, headers):
+        self.fetch_in_flight = False
+        print(f"Veri güncelleme hatası: {message}")
+        self.schedule_poll(self.poll_scheduler.failure(message, headers))
+        self.schedule_frame()
+
+    def on_rates_fetched(self, data, current_time, info):
+        self.fetch_in_flight = False
         try:
-            # Update the API URL with your actual API key
-            url = 'https://v6.exchangerate-api.com/v6/dac92d78d8c1d4a2893eff4d/latest/USD'
-            response = requests.get(url)
-            response.raise_for_status()  # Raises an error for bad responses
-            
-            data = response.json()  # Assuming the response is in JSON format
-            
-            current_time = datetime.now()
-            
-            # Güncel tarihi ayarla
-            self.date_label.setText(current_time.strftime('%Y-%m-%d %H:%M:%S'))
-
-            # Get the USD to TRY exchange rate
-            usd_to_try = float(data['conversion_rates']['TRY'])
-
-            for currency in self.currency_data.keys():
-                if currency in data['conversion_rates']:
-                    # Convert the current value to TRY
-                    current_value = float(data['conversion_rates'][currency]) * usd_to_try
-                    
-                    # Update data
-                    self.currency_data[currency]['values'].append(current_value)
-                    self.currency_data[currency]['times'].append(current_time)
-                    
-                    if len(self.currency_data[currency]['values']) > 50:
-                        self.currency_data[currency]['values'].pop(0)
-                        self.currency_data[currency]['times'].pop(0)
-                    
-                    # Update widgets
-                    widget = self.currency_widgets[currency]
-                    widget.value_label.setText(f'{current_value:.2f} TRY')  # Display in TRY
-                    
-                    # Calculate and update statistics
-                    values = self.currency_data[currency]['values']
-                    widget.high_label.setText(f'En Yüksek: {max(values):.2f} TRY')
-                    widget.low_label.setText(f'En Düşük: {min(values):.2f} TRY')
-                    widget.avg_label.setText(f'Ortalama: {sum(values)/len(values):.2f} TRY')
-                    
-                    # Update trend arrow
-                    last_value = self.currency_data[currency]['last_value']
-                    if current_value > last_value:
-                        widget.trend_label.setText('⬆')
-                        widget.trend_label.setStyleSheet('color: #2ecc71;')
-                    elif current_value < last_value:
-                        widget.trend_label.setText('⬇')
-                        widget.trend_label.setStyleSheet('color: #e74c3c;')
-                    else:
-                        widget.trend_label.setText('➡')
-                        widget.trend_label.setStyleSheet('color: #2c3e50;')
-                    
-                    self.currency_data[currency]['last_value'] = current_value
-            
-            self.update_graph()
-            
+            self.collector.ingest(data, current_time)
+            self.last_update = (current_time, info['cache'])
+            self.schedule_poll(self.poll_scheduler.success(info['changed'], info['headers']))
         except Exception as e:
             print(f"Veri güncelleme hatası: {e}")
+            self.schedule_poll(self.poll_scheduler.failure(e))
+        self.schedule_frame()
+
+    def schedule_frame(self):
+        # Aynı kare içinde gelen güncellemeler tek bir çizimde birleştirilir
+        if not self.frame_timer.isActive():
+            self.frame_timer.start()
+
+    def render_frame(self):
+        if self.last_update is not None:
+            current_time, cache_stats = self.last_update
+            # Güncel tarihi ayarla
+            set_text(self.date_label, current_time.strftime('%Y-%m-%d %H:%M:%S'))
+        else:
+            cache_stats = {'hits': 0, 'revalidated': 0, 'misses': 0}
+        scheduler = self.poll_scheduler
+        set_text(self.cache_stats,
+                 f"Önbellek isabet: {cache_stats['hits']}\n"
+                 f"Doğrulanan (304): {cache_stats['revalidated']}\n"
+                 f"İndirilen: {cache_stats['misses']}\n"
+                 f"Sorgu aralığı: {scheduler.interval:.1f} sn\n"
+                 f"Hata: {scheduler.total_errors} (ardışık {scheduler.failures})")
+        
+        # Sadece ekranda görünen kartlar güncellenir
+        self.board.refresh()
+        self.update_graph()
+        self.show_alerts()
+
+    def show_alerts(self):
+        alerts = self.collector.drain_alerts()
+        if not alerts:
+            return
+        for alert in alerts:
+            time_text = datetime.fromtimestamp(alert.timestamp).strftime('%H:%M:%S')
+            self.alert_list.insertItem(0, f"🔔 {time_text} {alert.message}")
+        while self.alert_list.count() > ALERT_LIST_SIZE:
+            self.alert_list.takeItem(self.alert_list.count() - 1)
 
     def setup_graph(self):
         self.graph_widget.setBackground('w')
@@ -187,40 +410,143 @@ class BorsaTakip(QMainWindow):
         self.graph_widget.setLabel('left', 'Değer (TRY)', **styles)
         self.graph_widget.setLabel('bottom', 'Zaman', **styles)
         self.graph_widget.addLegend()
-        self.graph_widget.setAutoVisible(y=True)
-        self.pen = pg.mkPen(color='#2196F3', width=2)
-    
-    def update_graph(self):
-        self.graph_widget.clear()
+        self.graph_widget.setTitle('Döviz Kurları Karşılaştırma', color='#2c3e50', size='14pt')
         
-        colors = {'USD': '#2196F3', 'EUR': '#4CAF50', 'GBP': '#9C27B0'}
+        # Yakınlaştırma/kaydırma sonrası çözünürlük yeniden seçilir; art arda gelen
+        # aralık değişiklikleri tek bir çizimde birleştirilir
+        self.graph_timer = QTimer()
+        self.graph_timer.setSingleShot(True)
+        self.graph_timer.setInterval(50)
+        self.graph_timer.timeout.connect(self.update_graph)
         
-        for currency, data in self.currency_data.items():
-            values = data['values']
-            
-            if values:
-                # Zaman indeksini oluştur
-                times = list(range(len(values)))  # Basit bir indeks kullanıyoruz
-                
-                pen = pg.mkPen(color=colors[currency], width=2)
-                self.graph_widget.plot(times, values, name=currency, pen=pen, symbol='o',
-                                       symbolSize=5, symbolBrush=colors[currency])
+        # pyqtgraph'ın tüm veriyi tarayan otomatik aralığı yerine, serilerde
+        # tutulan sınırlardan hesaplanan aralık kullanılır
+        view_box = self.graph_widget.getViewBox()
+        view_box.disableAutoRange()
+        view_box.sigXRangeChanged.connect(self.graph_timer.start)
+        view_box.sigRangeChangedManually.connect(self.disable_auto_range)
+        self.graph_widget.getPlotItem().autoBtn.clicked.connect(self.enable_auto_range)
+
+    def disable_auto_range(self):
+        self.auto_range = False
+
+    def enable_auto_range(self):
+        self.auto_range = True
+        self.graph_widget.getViewBox().disableAutoRange()
+        self.update_graph()
+
+    def graph_range(self, series):
+        if self.auto_range:
+            # Otomatik aralıkta tüm geçmiş görünür
+            return min(s.first_time for s in series), max(s.times.last() for s in series)
+        (x_min, x_max), _ = self.graph_widget.getViewBox().viewRange()
+        return x_min, x_max
+
+    def pick_graph_resolution(self, series, x_min, x_max, width):
+        resolution = pick_resolution(x_max - x_min, width // PIXELS_PER_POINT)
+        # Ham pencerenin gerisine bakılıyorsa en ince mumlar kullanılır
+        if resolution is None and x_min < min(s.times.first() for s in series):
+            resolution = RESOLUTIONS[0][0]
+        return resolution
+
+    def get_curve(self, currency):
+        # Her döviz için eğri bir kez oluşturulur, sonraki tick'lerde yerinde güncellenir
+        curve = self.curves.get(currency)
+        if curve is None:
+            color = CURRENCY_COLORS.get(currency)
+            if color is None:
+                color = pg.intColor(self.currencies.index(currency), hues=len(self.currencies))
+            curve = self.graph_widget.plot(name=currency, pen=pg.mkPen(color=color, width=2),
+                                           symbol='o', symbolSize=5, symbolBrush=color)
+            self.curves[currency] = curve
+            self.curve_symbols[currency] = True
+        return curve
+
+    def set_curve_data(self, currency, x, y):
+        curve = self.get_curve(currency)
+        # Çok sayıda noktada semboller hem okunmaz hem de pahalıdır
+        show_symbols = len(x) <= SYMBOL_LIMIT
+        if show_symbols != self.curve_symbols[currency]:
+            self.curve_symbols[currency] = show_symbols
+            curve.setSymbol('o' if show_symbols else None)
+        curve.setData(x, y)
+    
+    def update_graph(self):
+        # Grafikte ve özet panelde yalnızca listede görünen dövizler yer alır
+        visible = self.board.visible_currencies()
+        for currency in list(self.curves):
+            if currency not in visible:
+                self.graph_widget.removeItem(self.curves.pop(currency))
+                del self.curve_symbols[currency]
         
-        self.graph_widget.setTitle('Döviz Kurları Karşılaştırma', color='#2c3e50', size='14pt')
+        plotted = {c: self.currency_data[c] for c in visible if len(self.currency_data[c])}
+        if plotted:
+            self.plot_series(plotted)
         
         # İstatistikleri güncelle
         stats_text = ""
-        for currency in self.currency_data.keys():
-            values = self.currency_data[currency]['values']
-            if values:
+        for currency in visible:
+            series = self.currency_data[currency]
+            if len(series):
                 # Yüzde değişimi göster
-                change_percent = ((values[-1] - values[0]) / values[0] * 100) if values[0] != 0 else 0
-                stats_text += f"{currency}: {values[-1]:.2f} TRY ({change_percent:.2f}%)\n"
+                first, latest = series.first(), series.latest()
+                change_percent = ((latest - first) / first * 100) if first != 0 else 0
+                stats_text += f"{currency}: {latest:.2f} TRY ({change_percent:.2f}%)\n"
         
-        self.current_stats.setText(stats_text.strip())
+        set_text(self.current_stats, stats_text.strip())
+
+    def plot_series(self, plotted):
+        view_box = self.graph_widget.getViewBox()
+        width = max(1, int(view_box.width()))
+        x_min, x_max = self.graph_range(plotted.values())
+        
+        # Görünen aralığı dolduran en kaba mum çözünürlüğü seçilir, böylece
+        # çizilen nokta sayısı geçmişin uzunluğundan bağımsız kalır
+        resolution = self.pick_graph_resolution(plotted.values(), x_min, x_max, width)
+        if resolution != self.resolution:
+            self.resolution = resolution
+            self.graph_widget.setTitle(f'Döviz Kurları Karşılaştırma ({resolution or "tick"})',
+                                       color='#2c3e50', size='14pt')
+        
+        for currency, series in plotted.items():
+            if resolution is None:
+                times, values = series.times.to_array(), series.values.to_array()
+            else:
+                candles = series.candles[resolution]
+                times, values = candles.starts.to_array(), candles.closes.to_array()
+            # Yalnızca görünen aralık (kenarlardaki birer komşu noktayla) alınır ve
+            # piksel sütunu başına en düşük/en yüksek noktaya indirgenir
+            start = max(0, np.searchsorted(times, x_min, 'left') - 1)
+            end = min(len(times), np.searchsorted(times, x_max, 'right') + 1)
+            x, y = decimate_minmax(times[start:end], values[start:end], x_min, x_max, width)
+            self.set_curve_data(currency, x, y)
+        
+        if self.auto_range:
+            y_min = min(s.all_time_low for s in plotted.values())
+            y_max = max(s.all_time_high for s in plotted.values())
+            view_box.setRange(xRange=(x_min, x_max), yRange=(y_min, y_max), padding=0.02)
+            # Aralığı kendimiz değiştirdiğimiz için ikinci bir çizime gerek yok
+            self.graph_timer.stop()
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        self.fetch_thread.quit()
+        self.fetch_thread.wait()
+        self.fetch_worker.close()
+        self.collector.close()
+        super().closeEvent(event)
 
 if __name__ == '__main__':
-    app = QApplication(sys.argv)
-    window = BorsaTakip()
+    parser = argparse.ArgumentParser(description="Borsa Takip")
+    parser.add_argument('--dovizler', default=','.join(DEFAULT_CURRENCIES),
+                        help="İzlenecek dövizler, virgülle ayrılmış (örn. USD,EUR,JPY)")
+    parser.add_argument('--url', default=API_URL, help="Kur API adresi (örn. yerel taklit sunucu)")
+    parser.add_argument('--alarmlar', help="Alarm kurallarını içeren JSON dosyası")
+    args, qt_args = parser.parse_known_args()
+    
+    app = QApplication(sys.argv[:1] + qt_args)
+    alert_engine = AlertEngine.load(args.alarmlar) if args.alarmlar else None
+    window = BorsaTakip([c.strip().upper() for c in args.dovizler.split(',') if c.strip()], args.url,
+                        alert_engine=alert_engine)
     window.show()
     sys.exit(app.exec_())
\ No newline at end of file
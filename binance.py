@@ -1,4 +1,5 @@
 import sys
+import argparse
 import numpy as np
 import pandas as pd
 from PyQt5 import QtWidgets, QtCore, QtGui
@@ -8,24 +9,538 @@ from PyQt5.QtGui import *
 import pyqtgraph as pg
 from datetime import datetime, timedelta
 from binance.client import Client
-from ta.trend import SMAIndicator, EMAIndicator
-from ta.momentum import RSIIndicator
-from ta.volatility import BollingerBands
+from binance_onbellek import KlineCache, KLINE_COLUMNS, kline_frame
+from binance_grafik import CandlestickItem
+from binance_akis import KlineStream, STREAM_URLS, stream_url
+from binance_gosterge import IndicatorEngine
+from binance_tarayici import fetch_all, stack_klines, scan
+from binance_istek import INTERACTIVE, BACKGROUND, fetch_exchange_info
+from binance_semboller import SymbolCache, SymbolIndex, trading_symbols
+from binance_geriye_test import backtest, format_report
+from binance_optimizasyon import DEFAULT_GRID, METRICS, grid_params, random_params, sweep, heatmap
+
+# Binance API bağlantısı
+API_KEY = 'YOUR_API_KEY'  # Binance API anahtarınız
+API_SECRET = 'YOUR_API_SECRET'  # Binance API gizli anahtarınız
+
+
+def make_client(api_key, api_secret, rest_url=None):
+    """Binance istemcisi; `rest_url` verilirse istekler o adrese (örn. yerel taklit) gider."""
+    if rest_url is None:
+        return Client(api_key, api_secret)
+    client = Client(api_key, api_secret, ping=False)
+    client.API_URL = f'{rest_url}/api'
+    client.FUTURES_URL = f'{rest_url}/fapi'
+    return client
+
+
+class BinanceDataWorker(QObject):
+    """Binance isteklerini GUI thread'i dışında yapan çalışan.
+
+    Her istek artan bir numara taşır; GUI daha yeni bir istek gönderdiyse
+    (sembol/periyot değiştiyse) eski istek başlamadan ya da sayfalar arasında
+    bırakılır.
+    """
+    klines_fetched = pyqtSignal(int, object, object)
+    symbols_fetched = pyqtSignal(int, str, object)
+    backtest_finished = pyqtSignal(str)
+    failed = pyqtSignal(int, str)
+
+    def __init__(self, api_key=API_KEY, api_secret=API_SECRET, rest_url=None):
+        super().__init__()
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.rest_url = rest_url
+        self.client = None
+        self.kline_cache = None
+        self.symbol_cache = None
+        self.symbols = {}  # market -> SymbolIndex
+        # GUI thread'inin yazdığı en son istek numaraları
+        self.latest_klines = 0
+        self.latest_symbols = 0
+
+    def connect(self):
+        # İstemci (açılışta ping atar) ve SQLite bağlantısı bu thread'de oluşturulur
+        if self.client is None:
+            self.client = make_client(self.api_key, self.api_secret, self.rest_url)
+        if self.kline_cache is None:
+            self.kline_cache = KlineCache()
+
+    @pyqtSlot(int, str)
+    def load_symbols(self, request_id, market_type):
+        if request_id != self.latest_symbols:
+            return
+        try:
+            if market_type not in self.symbols:
+                if self.symbol_cache is None:
+                    self.symbol_cache = SymbolCache()
+                # exchangeInfo birkaç MB'tır; süresi dolmadıkça diskteki liste kullanılır
+                symbols = self.symbol_cache.get(market_type)
+                if symbols is None:
+                    self.connect()
+                    symbols = trading_symbols(fetch_exchange_info(self.client, market_type))
+                    self.symbol_cache.put(market_type, symbols)
+                if market_type == 'SPOT':
+                    # Spot piyasada yalnızca USDT ve BTC pariteleri
+                    symbols = [s for s in symbols if s[2] in ['USDT', 'BTC']]
+                self.symbols[market_type] = SymbolIndex(symbols)
+            self.symbols_fetched.emit(request_id, market_type, self.symbols[market_type])
+        except Exception as e:
+            self.failed.emit(request_id, f"Sembol listesi güncelleme hatası: {str(e)}")
+
+    @pyqtSlot(int, str, str, str, int, int)
+    def fetch_klines(self, request_id, market_type, symbol, interval, limit, priority):
+        def cancelled():
+            return request_id != self.latest_klines
+
+        if cancelled():
+            return
+        try:
+            self.connect()
+            # Veri çekme: önbellekte olmayan mumlar istenir, kalanı yerelden okunur
+            klines, _ = self.kline_cache.sync(self.client, market_type, symbol, interval, limit,
+                                              cancelled, priority)
+            if cancelled():
+                return
+            
+            # Tüm sütunları tipli DataFrame (zaman damgaları int64, fiyatlar float64)
+            df = kline_frame(klines)
+            
+            # Göstergeler burada bir kez hesaplanır; motor sonraki mumları O(1) günceller
+            engine = IndicatorEngine()
+            df[list(IndicatorEngine.COLUMNS)] = engine.extend(df['close'].values)
+            
+            self.klines_fetched.emit(request_id, df, engine)
+        except Exception as e:
+            self.failed.emit(request_id, f"Veri çekme hatası: {str(e)}")
+
+    @pyqtSlot(str, str, str, float, bool)
+    def run_backtest(self, market_type, symbol, interval, fee, require_volume):
+        try:
+            self.connect()
+            # Önbellekteki tüm geçmiş kullanılır
+            close, volume = self.kline_cache.load_columns(market_type, symbol, interval,
+                                                          ('close', 'volume'))
+            if len(close) == 0:
+                self.backtest_finished.emit(f"Önbellekte {symbol} - {interval} için mum yok")
+                return
+            result = backtest(close, volume, fee, require_volume=require_volume)
+            self.backtest_finished.emit(format_report(result, f"{symbol} - {interval}"))
+        except Exception as e:
+            self.failed.emit(0, f"Geriye test hatası: {str(e)}")
+
+    def close(self):
+        if self.kline_cache is not None:
+            self.kline_cache.close()
+        if self.client is not None:
+            self.client.close_connection()
+
+
+class ScannerWorker(QObject):
+    """Tüm sembolleri tarayan çalışan; mumlar ağırlık sınırlı havuzla çekilir."""
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object, int, object)  # isabetler, atlanan sembol sayısı, hatalar
+    failed = pyqtSignal(str)
+
+    def __init__(self, api_key=API_KEY, api_secret=API_SECRET, rest_url=None):
+        super().__init__()
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.rest_url = rest_url
+        self.client = None
+        self.cancelled = False
+
+    @pyqtSlot(str, object, str, int)
+    def scan(self, market_type, symbols, interval, limit):
+        self.cancelled = False
+        try:
+            if self.client is None:
+                self.client = make_client(self.api_key, self.api_secret, self.rest_url)
+            results, errors = fetch_all(
+                self.client, market_type, symbols, interval, limit,
+                progress=self.progress.emit, cancelled=lambda: self.cancelled
+            )
+            if self.cancelled:
+                return
+            names, opens, closes, volumes = stack_klines(results, limit)
+            self.finished.emit(scan(names, opens, closes, volumes), len(symbols) - len(names), errors)
+        except Exception as e:
+            self.failed.emit(f"Tarama hatası: {str(e)}")
+
+    def close(self):
+        if self.client is not None:
+            self.client.close_connection()
+
+
+class ScannerWindow(QWidget):
+    """Sinyal kurallarını tüm sembollerde değerlendiren tarayıcı penceresi."""
+    scan_requested = pyqtSignal(str, object, str, int)
+    symbol_selected = pyqtSignal(str)
+    COLUMNS = ['Sembol', 'Fiyat', 'Değişim %', 'RSI', 'Hacim Oranı', 'Trend %', 'Sinyaller']
+
+    def __init__(self, analyzer):
+        super().__init__(analyzer, Qt.Window)
+        self.analyzer = analyzer
+        self.setWindowTitle("Sembol Tarayıcı")
+        self.resize(900, 600)
+        layout = QVBoxLayout(self)
+        
+        controls = QHBoxLayout()
+        self.scan_btn = QPushButton("Tara")
+        self.scan_btn.clicked.connect(self.start_scan)
+        self.stop_btn = QPushButton("Durdur")
+        self.stop_btn.setEnabled(False)
+        self.stop_btn.clicked.connect(self.stop_scan)
+        self.status_label = QLabel("Taramak için 'Tara'ya basın")
+        self.progress_bar = QProgressBar()
+        controls.addWidget(self.scan_btn)
+        controls.addWidget(self.stop_btn)
+        controls.addWidget(self.progress_bar)
+        layout.addLayout(controls)
+        layout.addWidget(self.status_label)
+        
+        self.table = QTableWidget()
+        self.table.setColumnCount(len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.cellDoubleClicked.connect(
+            lambda row, column: self.symbol_selected.emit(self.table.item(row, 0).text())
+        )
+        layout.addWidget(self.table)
+        
+        self.thread = QThread(self)
+        self.worker = ScannerWorker(rest_url=analyzer.rest_url)
+        self.worker.moveToThread(self.thread)
+        self.scan_requested.connect(self.worker.scan)
+        self.worker.progress.connect(self.on_progress)
+        self.worker.finished.connect(self.on_finished)
+        self.worker.failed.connect(self.on_failed)
+        self.thread.start()
+
+    def start_scan(self):
+        combo = self.analyzer.symbol_combo
+        symbols = [combo.itemText(i) for i in range(combo.count())]
+        if not symbols:
+            return
+        market_type = self.analyzer.market_type_combo.currentText()
+        interval = self.analyzer.interval_combo.currentText()
+        self.scan_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        self.progress_bar.setRange(0, len(symbols))
+        self.progress_bar.setValue(0)
+        self.status_label.setText(f"{len(symbols)} sembol taranıyor ({market_type}, {interval})...")
+        self.scan_requested.emit(market_type, symbols, interval, 100)
+
+    def stop_scan(self):
+        self.worker.cancelled = True
+        self.scan_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+        self.status_label.setText("Tarama durduruldu")
+
+    def on_progress(self, done, total):
+        self.progress_bar.setValue(done)
+
+    def on_finished(self, rows, skipped, errors):
+        self.scan_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+        # Doldururken sıralama kapatılır, yoksa her eklemede satırlar yer değiştirir
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(rows))
+        for i, row in enumerate(rows):
+            self.table.setItem(i, 0, QTableWidgetItem(row['symbol']))
+            for column, key in enumerate(['close', 'change', 'RSI', 'volume_ratio', 'trend'], 1):
+                item = QTableWidgetItem()
+                # Sayısal değer verilir ki sütunlar sayı olarak sıralansın
+                item.setData(Qt.DisplayRole, round(row[key], 8 if key == 'close' else 2))
+                self.table.setItem(i, column, item)
+            self.table.setItem(i, 6, QTableWidgetItem(", ".join(row['signals'])))
+            if row['RSI'] > 70:
+                self.table.item(i, 3).setForeground(QColor('#ff0000'))
+            elif row['RSI'] < 30:
+                self.table.item(i, 3).setForeground(QColor('#00ff00'))
+        self.table.setSortingEnabled(True)
+        self.status_label.setText(
+            f"{len(rows)} sembolde sinyal bulundu"
+            f" ({skipped} sembol yetersiz veri ya da hata nedeniyle atlandı)"
+        )
+
+    def on_failed(self, message):
+        self.scan_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+        self.status_label.setText(message)
+
+    def shutdown(self):
+        self.worker.cancelled = True
+        self.thread.quit()
+        self.thread.wait()
+        self.worker.close()
+
+
+class SymbolCompleter(QCompleter):
+    """Sembol indeksiyle çalışan tamamlayıcı.
+
+    Her tuşta arama SymbolIndex'te yapılır ve modele yalnızca ilk `limit`
+    sonuç konur; QCompleter'ın binlerce satırlık modeli süzmesi gerekmez.
+    """
+
+    def __init__(self, line_edit, limit=50):
+        super().__init__(line_edit)
+        self.index = SymbolIndex([])
+        self.limit = limit
+        self.results = QStringListModel(self)
+        self.setModel(self.results)
+        self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.setCaseSensitivity(Qt.CaseInsensitive)
+        self.setMaxVisibleItems(15)
+        line_edit.setCompleter(self)
+        line_edit.textEdited.connect(self.update_results)
+
+    def set_index(self, index):
+        self.index = index
+        self.results.setStringList([])
+
+    def update_results(self, text):
+        self.results.setStringList(self.index.search(text, self.limit))
+        if self.results.rowCount():
+            self.complete()
+        else:
+            self.popup().hide()
+
+
+class OptimizerWorker(QObject):
+    """Önbellekteki mumlar üzerinde parametre taramasını süreç havuzunda çalıştırır."""
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object, int)  # satırlar, mum sayısı
+    failed = pyqtSignal(str)
 
-class BinanceAnalyzer(QMainWindow):
     def __init__(self):
         super().__init__()
-        # Binance API bağlantısı
-        self.api_key = 'YOUR_API_KEY'  # Binance API anahtarınız
-        self.api_secret = 'YOUR_API_SECRET'  # Binance API gizli anahtarınız
-        self.client = Client(self.api_key, self.api_secret)
+        self.cancelled = False
+
+    @pyqtSlot(str, str, str, object, float)
+    def optimize(self, market_type, symbol, interval, params, fee):
+        self.cancelled = False
+        try:
+            # SQLite bağlantısı oluşturulduğu thread'de kullanılmalı
+            cache = KlineCache()
+            try:
+                close, volume = cache.load_columns(market_type, symbol, interval, ('close', 'volume'))
+            finally:
+                cache.close()
+            if len(close) == 0:
+                self.failed.emit(f"Önbellekte {symbol} - {interval} için mum yok")
+                return
+            rows = sweep(close, volume, params, fee, progress=self.progress.emit,
+                         cancelled=lambda: self.cancelled)
+            if not self.cancelled:
+                self.finished.emit(rows, len(close))
+        except Exception as e:
+            self.failed.emit(f"Optimizasyon hatası: {str(e)}")
+
+
+class OptimizerWindow(QWidget):
+    """Gösterge ayarlarını geriye dönük testle tarayan pencere: sonuç tablosu ve ısı haritası."""
+    optimize_requested = pyqtSignal(str, str, str, object, float)
+
+    def __init__(self, analyzer):
+        super().__init__(analyzer, Qt.Window)
+        self.analyzer = analyzer
+        self.rows = []
+        self.setWindowTitle("Parametre Optimizasyonu")
+        self.resize(1000, 700)
+        layout = QVBoxLayout(self)
+        
+        controls = QHBoxLayout()
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(['Izgara', 'Rastgele'])
+        self.count_spin = QSpinBox()
+        self.count_spin.setRange(10, len(grid_params()))
+        self.count_spin.setValue(100)
+        self.start_btn = QPushButton("Başlat")
+        self.start_btn.clicked.connect(self.start_optimize)
+        self.stop_btn = QPushButton("Durdur")
+        self.stop_btn.setEnabled(False)
+        self.stop_btn.clicked.connect(self.stop_optimize)
+        self.progress_bar = QProgressBar()
+        controls.addWidget(QLabel("Arama:"))
+        controls.addWidget(self.mode_combo)
+        controls.addWidget(QLabel("Deneme:"))
+        controls.addWidget(self.count_spin)
+        controls.addWidget(self.start_btn)
+        controls.addWidget(self.stop_btn)
+        controls.addWidget(self.progress_bar)
+        layout.addLayout(controls)
+        self.status_label = QLabel("Seçili sembolün önbellekteki geçmişi kullanılır")
+        layout.addWidget(self.status_label)
+        
+        splitter = QSplitter(Qt.Vertical)
+        self.table = QTableWidget()
+        self.table.setColumnCount(len(DEFAULT_GRID) + len(METRICS))
+        self.table.setHorizontalHeaderLabels(list(DEFAULT_GRID) + [title for _, title in METRICS])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        splitter.addWidget(self.table)
+        
+        # Isı haritası: seçilen iki parametre, diğerlerinde en iyi getiri
+        heatmap_widget = QWidget()
+        heatmap_layout = QVBoxLayout(heatmap_widget)
+        axes = QHBoxLayout()
+        self.x_combo = QComboBox()
+        self.x_combo.addItems(list(DEFAULT_GRID))
+        self.y_combo = QComboBox()
+        self.y_combo.addItems(list(DEFAULT_GRID))
+        self.y_combo.setCurrentIndex(1)
+        self.x_combo.currentIndexChanged.connect(self.update_heatmap)
+        self.y_combo.currentIndexChanged.connect(self.update_heatmap)
+        axes.addWidget(QLabel("X:"))
+        axes.addWidget(self.x_combo)
+        axes.addWidget(QLabel("Y:"))
+        axes.addWidget(self.y_combo)
+        axes.addStretch()
+        heatmap_layout.addLayout(axes)
+        self.heatmap_plot = pg.PlotWidget()
+        self.heatmap_image = pg.ImageItem()
+        self.heatmap_image.setColorMap(pg.colormap.get('CET-D1A'))
+        self.heatmap_plot.addItem(self.heatmap_image)
+        self.heatmap_bar = pg.ColorBarItem(label="Getiri %", interactive=False)
+        self.heatmap_bar.setImageItem(self.heatmap_image, insert_in=self.heatmap_plot.getPlotItem())
+        heatmap_layout.addWidget(self.heatmap_plot)
+        splitter.addWidget(heatmap_widget)
+        layout.addWidget(splitter)
+        
+        self.thread = QThread(self)
+        self.worker = OptimizerWorker()
+        self.worker.moveToThread(self.thread)
+        self.optimize_requested.connect(self.worker.optimize)
+        self.worker.progress.connect(self.on_progress)
+        self.worker.finished.connect(self.on_finished)
+        self.worker.failed.connect(self.on_failed)
+        self.thread.start()
+
+    def start_optimize(self):
+        symbol = self.analyzer.symbol_combo.currentText()
+        if not symbol:
+            return
+        if self.mode_combo.currentText() == 'Rastgele':
+            params = random_params(count=self.count_spin.value())
+        else:
+            params = grid_params()
+        market_type = self.analyzer.market_type_combo.currentText()
+        interval = self.analyzer.interval_combo.currentText()
+        self.start_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        self.progress_bar.setRange(0, len(params))
+        self.progress_bar.setValue(0)
+        self.status_label.setText(f"{symbol} - {interval}: {len(params)} birleşim deneniyor...")
+        self.optimize_requested.emit(market_type, symbol, interval, params, 0.001)
+
+    def stop_optimize(self):
+        self.worker.cancelled = True
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+        self.status_label.setText("Optimizasyon durduruldu")
+
+    def on_progress(self, done, total):
+        self.progress_bar.setValue(done)
+
+    def on_finished(self, rows, candles):
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+        self.rows = rows
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(rows))
+        keys = list(DEFAULT_GRID) + [key for key, _ in METRICS]
+        for i, row in enumerate(rows):
+            for column, key in enumerate(keys):
+                value = row[key]
+                if key in dict(METRICS) and key != 'trades':
+                    value = round(value * 100, 2)
+                item = QTableWidgetItem()
+                item.setData(Qt.DisplayRole, value)
+                self.table.setItem(i, column, item)
+        self.table.setSortingEnabled(True)
+        self.update_heatmap()
+        if rows:
+            best = rows[0]
+            self.status_label.setText(
+                f"{candles} mum, {len(rows)} birleşim; en iyi getiri {best['pnl'] * 100:.2f}% ("
+                + ", ".join(f"{key}={best[key]:g}" for key in DEFAULT_GRID) + ")"
+            )
+
+    def update_heatmap(self):
+        x_key, y_key = self.x_combo.currentText(), self.y_combo.currentText()
+        if not self.rows or x_key == y_key:
+            self.heatmap_image.clear()
+            return
+        xs, ys, matrix = heatmap(self.rows, x_key, y_key)
+        matrix = matrix * 100
+        self.heatmap_image.setImage(matrix, autoLevels=False)
+        # Sıfır getiri renk skalasının ortasında kalır
+        limit = np.nanmax(np.abs(matrix)) or 1
+        self.heatmap_bar.setLevels((-limit, limit))
+        self.heatmap_plot.getAxis('bottom').setTicks([[(i + 0.5, f"{x:g}") for i, x in enumerate(xs)]])
+        self.heatmap_plot.getAxis('left').setTicks([[(j + 0.5, f"{y:g}") for j, y in enumerate(ys)]])
+        self.heatmap_plot.setLabel('bottom', x_key)
+        self.heatmap_plot.setLabel('left', y_key)
+
+    def on_failed(self, message):
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+        self.status_label.setText(message)
+
+    def shutdown(self):
+        self.worker.cancelled = True
+        self.thread.quit()
+        self.thread.wait()
+
+
+class BinanceAnalyzer(QMainWindow):
+    klines_requested = pyqtSignal(int, str, str, str, int, int)
+    symbols_requested = pyqtSignal(int, str)
+    backtest_requested = pyqtSignal(str, str, str, float, bool)
+
+    def __init__(self, stream_base=None, rest_url=None):
+        super().__init__()
+        # REST istekleri için adres (verilirse yerel taklit sunucu)
+        self.rest_url = rest_url
+        # Canlı mod: WebSocket akışı (stream_base verilirse yerel taklit sunucu)
+        self.stream_base = stream_base
+        self.stream = None
+        self.stream_key = None
+        self.stream_request = 0
+        # Akış olayları birikir, görünümler saniyede en fazla birkaç kez yenilenir
+        self.stream_timer = QTimer(self)
+        self.stream_timer.setSingleShot(True)
+        self.stream_timer.setInterval(250)
+        self.stream_timer.timeout.connect(self.refresh_views)
+        
+        # Ağ istekleri ayrı bir thread'de çalışır, sonuçlar sinyallerle gelir
+        self.klines_request = 0
+        self.symbols_request = 0
+        self.fetch_in_flight = False
+        self.fetch_priority = INTERACTIVE
+        self.data_thread = QThread(self)
+        self.data_worker = BinanceDataWorker(rest_url=rest_url)
+        self.data_worker.moveToThread(self.data_thread)
+        self.klines_requested.connect(self.data_worker.fetch_klines)
+        self.symbols_requested.connect(self.data_worker.load_symbols)
+        self.data_worker.klines_fetched.connect(self.on_klines_fetched)
+        self.data_worker.symbols_fetched.connect(self.on_symbols_fetched)
+        self.backtest_requested.connect(self.data_worker.run_backtest)
+        self.data_worker.backtest_finished.connect(self.on_backtest_finished)
+        self.data_worker.failed.connect(self.on_fetch_failed)
+        self.data_thread.start()
         
         self.setWindowTitle("Binance Borsa Analiz Platformu")
         self.setStyleSheet("""
             QMainWindow {
                 background-color: #1a1a2e;
             }
-            QLabel, QComboBox, QPushButton {
+            QLabel, QComboBox, QPushButton, QCheckBox {
                 color: #e6e6ff;
                 font-size: 14px;
                 padding: 8px;
@@ -59,6 +574,7 @@ class BinanceAnalyzer(QMainWindow):
         
         self.setup_ui()
         self.stock_data = pd.DataFrame()
+        self.indicator_engine = None
         self.setup_timer()
         self.update_data()
         self.setMinimumSize(1200, 800)
@@ -89,130 +605,229 @@ class BinanceAnalyzer(QMainWindow):
         # Sembol seçimi
         self.symbol_combo = QComboBox()
         self.symbol_combo.setEditable(True)
-        self.symbol_combo.setInsertPolicy(QComboBox.InsertPolicy.InsertAlphabetically)
+        # Liste hazır modelden gelir; yazılan metin listeye eklenmez
+        self.symbol_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self.symbol_model = QStringListModel(self)
+        self.symbol_combo.setModel(self.symbol_model)
+        self.symbol_completer = SymbolCompleter(self.symbol_combo.lineEdit())
+        self.symbol_completer.activated[str].connect(self.select_symbol)
+        self.symbol_combo.currentIndexChanged.connect(self.on_selection_changed)
         self.top_panel.addWidget(QLabel("Sembol:"))
         self.top_panel.addWidget(self.symbol_combo)
         
         # Zaman aralığı seçimi
         self.interval_combo = QComboBox()
         self.interval_combo.addItems(['1m', '5m', '15m', '1h', '4h', '1d'])
+        self.interval_combo.currentIndexChanged.connect(self.on_selection_changed)
         self.top_panel.addWidget(QLabel("Periyot:"))
         self.top_panel.addWidget(self.interval_combo)
         
+        # Mum sayısı seçimi (500'ün ötesi önbelleğe sayfalı isteklerle doldurulur)
+        self.candles_combo = QComboBox()
+        self.candles_combo.addItems(['500', '1000', '2000', '5000'])
+        self.candles_combo.currentIndexChanged.connect(self.on_selection_changed)
+        self.top_panel.addWidget(QLabel("Mum:"))
+        self.top_panel.addWidget(self.candles_combo)
+        
         # Analiz türü seçimi
         self.analysis_combo = QComboBox()
         self.analysis_combo.addItems(['SMA', 'EMA', 'RSI', 'Bollinger'])
         self.top_panel.addWidget(QLabel("Analiz:"))
         self.top_panel.addWidget(self.analysis_combo)
         
+        # Canlı mod: periyodik sorgu yerine WebSocket akışı
+        self.live_check = QCheckBox("Canlı")
+        self.live_check.toggled.connect(self.on_live_toggled)
+        self.top_panel.addWidget(self.live_check)
+        
         # Yenile butonu
         self.refresh_btn = QPushButton("Yenile")
-        self.refresh_btn.clicked.connect(self.update_data)
+        self.refresh_btn.clicked.connect(lambda: self.update_data())
         self.top_panel.addWidget(self.refresh_btn)
         
+        # Sinyal kurallarının önbellekteki geçmiş üzerinde testi (%0.1 komisyonla)
+        self.backtest_btn = QPushButton("Geriye Test")
+        self.backtest_btn.clicked.connect(self.run_backtest)
+        self.top_panel.addWidget(self.backtest_btn)
+        # Alımlarda grafikteki gibi hacim patlaması (2 kat ortalama) şartı aranır
+        self.volume_check = QCheckBox("Hacim şartı")
+        self.volume_check.setChecked(True)
+        self.top_panel.addWidget(self.volume_check)
+        
+        # Gösterge ayarları için parametre taraması
+        self.optimizer = None
+        self.optimizer_btn = QPushButton("Optimizasyon")
+        self.optimizer_btn.clicked.connect(self.open_optimizer)
+        self.top_panel.addWidget(self.optimizer_btn)
+        
+        # Tüm sembollerde sinyal taraması
+        self.scanner = None
+        self.scanner_btn = QPushButton("Tarayıcı")
+        self.scanner_btn.clicked.connect(self.open_scanner)
+        self.top_panel.addWidget(self.scanner_btn)
+        
         self.layout.addLayout(self.top_panel)
         self.update_symbol_list(self.market_type_combo.currentText())
 
     def update_symbol_list(self, market_type):
-        try:
-            self.symbol_combo.clear()
-            if market_type == 'SPOT':
-                # Spot piyasa sembollerini al
-                exchange_info = self.client.get_exchange_info()
-                symbols = [s['symbol'] for s in exchange_info['symbols'] 
-                          if s['status'] == 'TRADING' and s['quoteAsset'] in ['USDT', 'BTC']]
-            else:
-                # Vadeli işlem sembollerini al
-                futures_exchange_info = self.client.futures_exchange_info()
-                symbols = [s['symbol'] for s in futures_exchange_info['symbols'] 
-                          if s['status'] == 'TRADING']
-            
-            symbols.sort()
-            self.symbol_combo.addItems(symbols)
-            
-        except Exception as e:
-            self.statusBar.showMessage(f"Sembol listesi güncelleme hatası: {str(e)}", 5000)
+        self.symbols_request += 1
+        self.data_worker.latest_symbols = self.symbols_request
+        self.symbols_requested.emit(self.symbols_request, market_type)
 
-    def fetch_binance_data(self):
-        try:
-            symbol = self.symbol_combo.currentText()
-            interval = self.interval_combo.currentText()
-            market_type = self.market_type_combo.currentText()
-            
-            # Zaman aralığını hesapla
-            end_time = int(datetime.now().timestamp() * 1000)
-            if interval == '1m':
-                start_time = end_time - (1000 * 60 * 500)  # Son 500 dakika
-            elif interval == '5m':
-                start_time = end_time - (1000 * 60 * 5 * 500)  # Son 500 5-dakika
-            elif interval == '15m':
-                start_time = end_time - (1000 * 60 * 15 * 500)  # Son 500 15-dakika
-            elif interval == '1h':
-                start_time = end_time - (1000 * 60 * 60 * 500)  # Son 500 saat
-            elif interval == '4h':
-                start_time = end_time - (1000 * 60 * 60 * 4 * 500)  # Son 500 4-saat
-            else:  # 1d
-                start_time = end_time - (1000 * 60 * 60 * 24 * 500)  # Son 500 gün
-            
-            # Veri çekme
-            if market_type == 'SPOT':
-                klines = self.client.get_klines(
-                    symbol=symbol,
-                    interval=interval,
-                    startTime=start_time,
-                    endTime=end_time
-                )
-            else:
-                klines = self.client.futures_klines(
-                    symbol=symbol,
-                    interval=interval,
-                    startTime=start_time,
-                    endTime=end_time
-                )
-            
-            # Verileri DataFrame'e dönüştür
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
-            
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
-            
-            # Sayısal sütunları dönüştür
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-            
-            self.stock_data = df
-            self.statusBar.showMessage(f"Veri başarıyla güncellendi: {symbol}", 5000)
-            return True
-            
-        except Exception as e:
-            self.statusBar.showMessage(f"Veri çekme hatası: {str(e)}", 5000)
+    def on_symbols_fetched(self, request_id, market_type, index):
+        if request_id != self.symbols_request:
+            return  # Bu arada market değişti
+        current = self.symbol_combo.currentText()
+        # Liste doldurulurken her ara seçim için istek gönderilmesin
+        self.symbol_combo.blockSignals(True)
+        self.symbol_model.setStringList(index.names)
+        self.symbol_completer.set_index(index)
+        if current in index.names:
+            self.symbol_combo.setCurrentIndex(self.symbol_combo.findText(current))
+        self.symbol_combo.blockSignals(False)
+        self.on_selection_changed()
+
+    def on_selection_changed(self, *args):
+        # Süren istek eskidi; yeni seçim için hemen istek yapılır
+        self.fetch_in_flight = False
+        # Akış, yeni seçimin geçmişi geldiğinde yeniden başlatılır
+        self.stop_stream()
+        self.setup_timer()
+        self.update_data()
+
+    def fetch_binance_data(self, priority=INTERACTIVE):
+        symbol = self.symbol_combo.currentText()
+        if not symbol:
             return False
+        # Etkileşimli istek, sırada bekleyen arka plan isteğinin yerine geçer
+        if self.fetch_in_flight and not (priority < self.fetch_priority):
+            return False
+        self.fetch_in_flight = True
+        self.fetch_priority = priority
+        self.klines_request += 1
+        self.data_worker.latest_klines = self.klines_request
+        self.klines_requested.emit(
+            self.klines_request,
+            self.market_type_combo.currentText(),
+            symbol,
+            self.interval_combo.currentText(),
+            int(self.candles_combo.currentText()),
+            priority
+        )
+        return True
+
+    def on_klines_fetched(self, request_id, df, engine):
+        if request_id != self.klines_request:
+            return  # Eski seçime ait yanıt
+        self.fetch_in_flight = False
+        self.stock_data = df
+        self.indicator_engine = engine
+        self.refresh_views()
+        if self.live_check.isChecked():
+            self.start_stream()
+        
+        current_time = datetime.now().strftime('%H:%M:%S')
+        self.statusBar.showMessage(
+            f"Son güncelleme: {current_time} - {self.symbol_combo.currentText()}", 
+            5000
+        )
+
+    def refresh_views(self):
+        self.update_graph()
+        self.update_table()
+        self.update_signals()
+
+    def on_live_toggled(self, checked):
+        self.setup_timer()
+        if not checked:
+            self.stop_stream()
+        elif len(self.stock_data):
+            self.start_stream()
+        else:
+            self.update_data()
 
-    def calculate_indicators(self):
+    def start_stream(self):
+        market_type = self.market_type_combo.currentText()
+        symbol = self.symbol_combo.currentText()
+        interval = self.interval_combo.currentText()
+        key = (market_type, symbol, interval)
+        if self.stream is not None and self.stream_key == key:
+            return
+        self.stop_stream()
+        self.stream_request += 1
+        self.stream_key = key
+        base = self.stream_base or STREAM_URLS[market_type]
+        self.stream = KlineStream(self.stream_request, stream_url(base, symbol, interval))
+        self.stream.kline_received.connect(self.on_stream_kline)
+        self.stream.trades_received.connect(self.on_stream_trades)
+        self.stream.status_changed.connect(self.on_stream_status)
+        self.stream.start()
+
+    def stop_stream(self):
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream = None
+            self.stream_key = None
+
+    def on_stream_kline(self, stream_id, row, closed):
+        if stream_id != self.stream_request or len(self.stock_data) == 0:
+            return  # Eski akıştan kalan olay
+        df = self.stock_data
+        timestamp = pd.to_datetime(row[0], unit='ms')
+        if timestamp < df.index[-1]:
+            return
+        # Son mum yerinde güncellenir, yeni mum sona eklenir
+        new_candle = timestamp > df.index[-1]
+        if new_candle:
+            # loc ile genişletmek tamsayı sütunları float'a çevirir; tipli satır eklenir
+            df = self.stock_data = pd.concat([df, kline_frame([row])])
+        else:
+            df.loc[timestamp, KLINE_COLUMNS[1:-1]] = row[1:-1]
+        self.calculate_indicators(new_candle)
+        limit = int(self.candles_combo.currentText())
+        if len(df) > limit:
+            self.stock_data = df.iloc[-limit:].copy()
+        self.schedule_refresh()
+
+    def on_stream_trades(self, stream_id, trade_time, last, high, low):
+        if stream_id != self.stream_request or len(self.stock_data) == 0:
+            return
+        df = self.stock_data
+        # Yeni mumun işlemleri, mum olayı gelene kadar bekletilmez; yok sayılır
+        if trade_time > df['close_time'].iloc[-1]:
+            return
+        row = df.index[-1]
+        df.loc[row, 'close'] = last
+        df.loc[row, 'high'] = max(df.loc[row, 'high'], high)
+        df.loc[row, 'low'] = min(df.loc[row, 'low'], low)
+        self.calculate_indicators()
+        self.schedule_refresh()
+
+    def on_stream_status(self, stream_id, message):
+        if stream_id == self.stream_request:
+            self.statusBar.showMessage(message, 5000)
+
+    def schedule_refresh(self):
+        if not self.stream_timer.isActive():
+            self.stream_timer.start()
+
+    def on_fetch_failed(self, request_id, message):
+        if request_id == self.klines_request:
+            self.fetch_in_flight = False
+        self.statusBar.showMessage(message, 5000)
+
+    def calculate_indicators(self, new_candle=False):
+        """Son mumun göstergelerini güncelle; yeni mum eklendiyse motora itilir."""
         if len(self.stock_data) == 0:
             return
         
         try:
-            # SMA hesaplama
-            sma = SMAIndicator(close=self.stock_data['close'], window=20)
-            self.stock_data['SMA20'] = sma.sma_indicator()
-            
-            # EMA hesaplama
-            ema = EMAIndicator(close=self.stock_data['close'], window=20)
-            self.stock_data['EMA20'] = ema.ema_indicator()
-            
-            # RSI hesaplama
-            rsi = RSIIndicator(close=self.stock_data['close'], window=14)
-            self.stock_data['RSI'] = rsi.rsi()
-            
-            # Bollinger Bands hesaplama
-            bollinger = BollingerBands(close=self.stock_data['close'], window=20)
-            self.stock_data['BB_upper'] = bollinger.bollinger_hband()
-            self.stock_data['BB_lower'] = bollinger.bollinger_lband()
+            close = self.stock_data['close'].iloc[-1]
+            if new_candle:
+                values = self.indicator_engine.push(close)
+            else:
+                values = self.indicator_engine.replace(close)
+            self.stock_data.loc[self.stock_data.index[-1], list(IndicatorEngine.COLUMNS)] = values
             
         except Exception as e:
             self.statusBar.showMessage(f"İndikatör hesaplama hatası: {str(e)}", 5000)
@@ -221,28 +836,17 @@ class BinanceAnalyzer(QMainWindow):
         try:
             self.graph_widget.clear()
             
-            timestamps = [i for i in range(len(self.stock_data))]
+            timestamps = np.arange(len(self.stock_data))
             
-            # Mum grafiği
-            for i in range(len(self.stock_data)):
-                row = self.stock_data.iloc[i]
-                if row['close'] >= row['open']:
-                    color = '#00ff00'  # Yeşil mum
-                else:
-                    color = '#ff0000'  # Kırmızı mum
-                
-                # Gövde
-                self.graph_widget.plot(
-                    x=[i, i],
-                    y=[row['open'], row['close']],
-                    pen=pg.mkPen(color=color, width=3)
-                )
-                # Fitil
-                self.graph_widget.plot(
-                    x=[i, i],
-                    y=[row['low'], row['high']],
-                    pen=pg.mkPen(color=color, width=1)
-                )
+            # Mum grafiği: tüm mumlar tek öğede çizilir
+            self.candle_item.set_data(
+                timestamps,
+                self.stock_data['open'].values,
+                self.stock_data['high'].values,
+                self.stock_data['low'].values,
+                self.stock_data['close'].values
+            )
+            self.graph_widget.addItem(self.candle_item)
             
             # Seçili indikatör
             analysis_type = self.analysis_combo.currentText()
@@ -261,17 +865,7 @@ class BinanceAnalyzer(QMainWindow):
                     name='EMA20'
                 )
             elif analysis_type == 'RSI':
-                rsi_widget = pg.ViewBox()
-                p1 = self.graph_widget.plotItem
-                p1.scene().addItem(rsi_widget)
-                p1.getAxis('right').linkToView(rsi_widget)
-                rsi_widget.setXLink(p1)
-                
-                pg.PlotDataItem(
-                    x=timestamps,
-                    y=self.stock_data['RSI'].values,
-                    pen=pg.mkPen(color='#ffff00', width=2)
-                )
+                self.rsi_curve.setData(x=timestamps, y=self.stock_data['RSI'].values)
             elif analysis_type == 'Bollinger':
                 self.graph_widget.plot(
                     x=timestamps,
@@ -286,6 +880,13 @@ class BinanceAnalyzer(QMainWindow):
                     name='Bollinger Alt'
                 )
             
+            # RSI sağ eksende, fiyattan bağımsız 0-100 ölçeğinde gösterilir
+            rsi_visible = analysis_type == 'RSI'
+            self.rsi_view.setVisible(rsi_visible)
+            if rsi_visible:
+                self.update_rsi_geometry()
+            self.graph_widget.plotItem.showAxis('right', rsi_visible)
+            
             # Grafik başlığı
             self.graph_widget.setTitle(
                 f"{self.symbol_combo.currentText()} - {self.interval_combo.currentText()}",
@@ -308,8 +909,27 @@ class BinanceAnalyzer(QMainWindow):
         self.graph_widget.setLabel('left', 'Fiyat', **styles)
         self.graph_widget.setLabel('bottom', 'Zaman', **styles)
         
+        self.candle_item = CandlestickItem()
+        
+        # RSI için ikinci ViewBox bir kez oluşturulur; yenilemelerde yalnızca verisi değişir
+        plot_item = self.graph_widget.plotItem
+        self.rsi_view = pg.ViewBox()
+        plot_item.scene().addItem(self.rsi_view)
+        plot_item.getAxis('right').linkToView(self.rsi_view)
+        plot_item.getAxis('right').setLabel('RSI', **styles)
+        self.rsi_view.setXLink(plot_item)
+        self.rsi_view.setYRange(0, 100)
+        self.rsi_view.setMouseEnabled(y=False)
+        self.rsi_curve = pg.PlotDataItem(pen=pg.mkPen(color='#ffff00', width=2))
+        self.rsi_view.addItem(self.rsi_curve)
+        self.rsi_view.setVisible(False)
+        plot_item.vb.sigResized.connect(self.update_rsi_geometry)
+        
         self.layout.addWidget(self.graph_widget)
 
+    def update_rsi_geometry(self):
+        self.rsi_view.setGeometry(self.graph_widget.plotItem.vb.sceneBoundingRect())
+
     def create_indicators_table(self):
         self.indicators_table = QTableWidget()
         self.indicators_table.setColumnCount(7)
@@ -441,8 +1061,10 @@ class BinanceAnalyzer(QMainWindow):
             self.statusBar.showMessage(f"Sinyal güncelleme hatası: {str(e)}", 5000)
 
     def setup_timer(self):
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_data)
+        if not hasattr(self, 'timer'):
+            self.timer = QTimer()
+            # Periyodik yenileme arka plan önceliğiyle sıraya girer
+            self.timer.timeout.connect(lambda: self.update_data(BACKGROUND))
         
         # Seçili periyoda göre güncelleme sıklığını ayarla
         interval_map = {
@@ -454,29 +1076,72 @@ class BinanceAnalyzer(QMainWindow):
             '1d': 3600000   # 1 saat
         }
         current_interval = self.interval_combo.currentText()
-        self.timer.start(interval_map.get(current_interval, 60000))
+        if self.live_check.isChecked():
+            self.timer.stop()  # Canlı modda veriler akıştan gelir
+        else:
+            self.timer.start(interval_map.get(current_interval, 60000))
 
-    def update_data(self):
+    def run_backtest(self):
+        symbol = self.symbol_combo.currentText()
+        if not symbol:
+            return
+        self.statusBar.showMessage(f"Geriye test çalışıyor: {symbol}", 5000)
+        self.backtest_requested.emit(self.market_type_combo.currentText(), symbol,
+                                     self.interval_combo.currentText(), 0.001,
+                                     self.volume_check.isChecked())
+
+    def on_backtest_finished(self, report):
+        self.signals_text.setText(report)
+
+    def open_scanner(self):
+        if self.scanner is None:
+            self.scanner = ScannerWindow(self)
+            self.scanner.symbol_selected.connect(self.select_symbol)
+        self.scanner.show()
+        self.scanner.raise_()
+
+    def open_optimizer(self):
+        if self.optimizer is None:
+            self.optimizer = OptimizerWindow(self)
+        self.optimizer.show()
+        self.optimizer.raise_()
+
+    def select_symbol(self, symbol):
+        index = self.symbol_combo.findText(symbol)
+        if index >= 0:
+            self.symbol_combo.setCurrentIndex(index)
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        self.stop_stream()
+        if self.scanner is not None:
+            self.scanner.shutdown()
+        if self.optimizer is not None:
+            self.optimizer.shutdown()
+        self.data_worker.latest_klines = -1  # Süren sayfalı istek bırakılsın
+        self.data_thread.quit()
+        self.data_thread.wait()
+        self.data_worker.close()
+        super().closeEvent(event)
+
+    def update_data(self, priority=INTERACTIVE):
         """Tüm verileri ve göstergeleri güncelle"""
-        if self.fetch_binance_data():
-            self.calculate_indicators()
-            self.update_graph()
-            self.update_table()
-            self.update_signals()
-            
-            current_time = datetime.now().strftime('%H:%M:%S')
-            self.statusBar.showMessage(
-                f"Son güncelleme: {current_time} - {self.symbol_combo.currentText()}", 
-                5000
-            )
+        # Sonuç geldiğinde göstergeler ve grafik on_klines_fetched içinde güncellenir
+        if self.fetch_binance_data(priority):
+            self.statusBar.showMessage(f"Veri çekiliyor: {self.symbol_combo.currentText()}", 5000)
 
 def main():
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Binance Borsa Analiz Platformu")
+    parser.add_argument('--akis-url', help="Canlı mod için WebSocket adresi (örn. yerel taklit sunucu)")
+    parser.add_argument('--rest-url', help="REST istekleri için adres (örn. yerel taklit sunucu)")
+    args, qt_args = parser.parse_known_args()
+    
+    app = QApplication(sys.argv[:1] + qt_args)
     font = QFont("Arial", 10)
     app.setFont(font)
     app.setStyle("Fusion")
     
-    window = BinanceAnalyzer()
+    window = BinanceAnalyzer(args.akis_url, args.rest_url)
     window.show()
     
     sys.exit(app.exec_())
@@ -0,0 +1,122 @@
+import json
+import threading
+import time
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from websockets.sync.client import connect
+
+STREAM_URLS = {
+    'SPOT': 'wss://stream.binance.com:9443',
+    'FUTURES': 'wss://fstream.binance.com',
+}
+
+
+def stream_url(base, symbol, interval):
+    """Mum ve toplu işlem (aggTrade) akışlarını birleştiren akış adresi."""
+    name = symbol.lower()
+    return f"{base}/stream?streams={name}@kline_{interval}/{name}@aggTrade"
+
+
+def parse_kline(kline):
+    """Akıştaki mum olayını REST ile aynı 12 sütunlu satıra çevir."""
+    return [
+        int(kline['t']), float(kline['o']), float(kline['h']), float(kline['l']),
+        float(kline['c']), float(kline['v']), int(kline['T']), float(kline['q']),
+        int(kline['n']), float(kline['V']), float(kline['Q']), 0
+    ]
+
+
+class KlineStream(QObject):
+    """Bir sembol/periyot için WebSocket mum akışı.
+
+    Alım arka plandaki bir thread'de yapılır. Mum olayları olduğu gibi,
+    işlemler ise `trade_interval` boyunca birleştirilip (son fiyat, en yüksek,
+    en düşük) sinyal olarak iletilir; böylece yoğun sembollerde GUI kuyruğu
+    işlem başına olayla dolmaz. Bağlantı koparsa üstel bekleme ile yeniden
+    bağlanılır.
+    """
+    kline_received = pyqtSignal(int, object, bool)  # akış no, satır, mum kapandı mı
+    trades_received = pyqtSignal(int, object, float, float, float)  # akış no, zaman (ms), son, yüksek, düşük
+    status_changed = pyqtSignal(int, str)
+
+    def __init__(self, stream_id, url, trade_interval=0.1, max_backoff=60.0):
+        super().__init__()
+        self.stream_id = stream_id
+        self.url = url
+        self.trade_interval = trade_interval
+        self.max_backoff = max_backoff
+        self.websocket = None
+        self.trades = None  # [zaman, son, yüksek, düşük]
+        self.last_flush = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='KlineStream', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        # Bloklamaz; alım thread'i bağlantı kapanınca kendiliğinden biter
+        self._stop.set()
+        websocket = self.websocket
+        if websocket is not None:
+            websocket.close()
+
+    def _run(self):
+        backoff = 1.0
+        while not self._stop.is_set():
+            try:
+                with connect(self.url, open_timeout=10, close_timeout=1) as websocket:
+                    self.websocket = websocket
+                    if self._stop.is_set():
+                        break
+                    backoff = 1.0
+                    self.status_changed.emit(self.stream_id, "Canlı akış bağlandı")
+                    self._receive(websocket)
+            except Exception as e:
+                if self._stop.is_set():
+                    break
+                self.status_changed.emit(
+                    self.stream_id, f"Canlı akış koptu ({e}), {backoff:.0f} sn sonra yeniden bağlanılacak"
+                )
+            finally:
+                self.websocket = None
+            self._stop.wait(backoff)
+            backoff = min(self.max_backoff, backoff * 2)
+
+    def _receive(self, websocket):
+        while not self._stop.is_set():
+            try:
+                message = websocket.recv(timeout=self.trade_interval)
+            except TimeoutError:
+                self._flush_trades()
+                continue
+            self._handle(json.loads(message))
+            if time.monotonic() - self.last_flush >= self.trade_interval:
+                self._flush_trades()
+
+    def _handle(self, message):
+        # Birleşik akışta olay 'data' alanındadır
+        event = message.get('data', message)
+        kind = event.get('e')
+        if kind == 'kline':
+            # Mum olayı son işlemleri de kapsar; önce bekleyenler iletilir
+            self._flush_trades()
+            kline = event['k']
+            self.kline_received.emit(self.stream_id, parse_kline(kline), bool(kline['x']))
+        elif kind in ('aggTrade', 'trade'):
+            price = float(event['p'])
+            trade_time = int(event['T'])
+            if self.trades is None:
+                self.trades = [trade_time, price, price, price]
+            else:
+                trades = self.trades
+                trades[0] = trade_time
+                trades[1] = price
+                trades[2] = max(trades[2], price)
+                trades[3] = min(trades[3], price)
+
+    def _flush_trades(self):
+        self.last_flush = time.monotonic()
+        if self.trades is not None:
+            trades, self.trades = self.trades, None
+            self.trades_received.emit(self.stream_id, *trades)
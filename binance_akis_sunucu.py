@@ -0,0 +1,154 @@
+"""Binance WebSocket akışının yerel taklidi.
+
+Kaydedilmiş (ya da sentetik) akış çerçevelerini, kayıttaki zamanlamayla her
+bağlanan istemciye yeniden oynatır; canlı borsaya bağlanmadan BinanceAnalyzer'ın
+canlı modunu denemek için kullanılır:
+
+    python binance_akis_sunucu.py --kaydet btc.jsonl --sure 120
+    python binance_akis_sunucu.py --kayit btc.jsonl --port 8766
+    python binance.py --akis-url ws://127.0.0.1:8766
+"""
+import argparse
+import json
+import random
+import threading
+import time
+
+from websockets.sync.client import connect
+from websockets.sync.server import serve
+
+from binance_akis import STREAM_URLS, stream_url
+from binance_onbellek import INTERVAL_MS
+
+
+def load_frames(path):
+    """Kayıt dosyasındaki (zaman, çerçeve) çiftleri; zaman kaydın başından saniyedir."""
+    frames = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                item = json.loads(line)
+                frames.append((item['t'], item['frame']))
+    return frames
+
+
+def record(url, path, seconds):
+    """Gerçek akıştan `seconds` saniye boyunca gelen çerçeveleri dosyaya yaz."""
+    count = 0
+    start = time.monotonic()
+    with connect(url) as websocket, open(path, 'w', encoding='utf-8') as f:
+        while True:
+            remaining = seconds - (time.monotonic() - start)
+            if remaining <= 0:
+                break
+            try:
+                frame = websocket.recv(timeout=remaining)
+            except TimeoutError:
+                break
+            f.write(json.dumps({'t': round(time.monotonic() - start, 3), 'frame': frame}) + '\n')
+            count += 1
+    return count
+
+
+def synthetic_frames(symbol='BTCUSDT', interval='1m', candles=5, trades=20, candle_seconds=2.0,
+                     price=30000.0, seed=None):
+    """Birleşik akış biçiminde sentetik işlem ve mum çerçeveleri.
+
+    İlk mum şu anki periyodun açılış zamanıyla başlar; her mum oynatmada
+    `candle_seconds` sürer ve sonunda kapanmış (x=true) olarak gönderilir.
+    """
+    rng = random.Random(seed)
+    step = INTERVAL_MS[interval]
+    open_time = int(time.time() * 1000) // step * step
+    name = symbol.lower()
+    frames = []
+    trade_id = 0
+    for candle in range(candles):
+        start = open_time + candle * step
+        open = high = low = close = price
+        volume = quote = 0.0
+        for trade in range(trades):
+            close = price = round(price * (1 + rng.gauss(0, 0.0005)), 2)
+            high, low = max(high, close), min(low, close)
+            quantity = round(rng.uniform(0.001, 0.5), 3)
+            volume += quantity
+            quote += quantity * close
+            trade_id += 1
+            offset = candle * candle_seconds + (trade + 1) * candle_seconds / (trades + 1)
+            event_time = start + (trade + 1) * step // (trades + 1)
+            frames.append((offset, json.dumps({'stream': f'{name}@aggTrade', 'data': {
+                'e': 'aggTrade', 'E': event_time, 's': symbol, 'a': trade_id, 'p': f'{close:.2f}',
+                'q': f'{quantity:.3f}', 'T': event_time, 'm': rng.random() < 0.5,
+            }})))
+            closed = trade == trades - 1
+            # Gerçek akış gibi mum güncellemesi birkaç işlemde bir gelir
+            if trade % 5 == 4 or closed:
+                frames.append((offset, json.dumps({'stream': f'{name}@kline_{interval}', 'data': {
+                    'e': 'kline', 'E': event_time, 's': symbol, 'k': {
+                        't': start, 'T': start + step - 1, 's': symbol, 'i': interval,
+                        'o': f'{open:.2f}', 'c': f'{close:.2f}', 'h': f'{high:.2f}',
+                        'l': f'{low:.2f}', 'v': f'{volume:.3f}', 'n': trade + 1, 'x': closed,
+                        'q': f'{quote:.2f}', 'V': f'{volume / 2:.3f}', 'Q': f'{quote / 2:.2f}',
+                    }
+                }})))
+    return frames
+
+
+def make_handler(frames, speed):
+    def handler(websocket):
+        start = time.monotonic()
+        try:
+            for offset, frame in frames:
+                delay = offset / speed - (time.monotonic() - start)
+                if delay > 0:
+                    time.sleep(delay)
+                websocket.send(frame)
+            # Kayıt bitince bağlantı istemci kapatana kadar açık tutulur
+            for _ in websocket:
+                pass
+        except Exception:
+            pass  # İstemci ayrıldı
+
+    return handler
+
+
+def start_server(frames, port=0, speed=1.0):
+    """Sunucuyu arka planda başlat; (sunucu, temel adres) döndürür. port=0 boş port seçer."""
+    server = serve(make_handler(frames, speed), '127.0.0.1', port, compression=None)
+    threading.Thread(target=server.serve_forever, name='MockStreamServer', daemon=True).start()
+    return server, f'ws://127.0.0.1:{server.socket.getsockname()[1]}'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yerel Binance akış sunucusu")
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--kayit', help="Oynatılacak kayıt dosyası (verilmezse sentetik akış)")
+    parser.add_argument('--hiz', type=float, default=1.0, help="Oynatma hızı çarpanı")
+    parser.add_argument('--kaydet', help="Gerçek akışı bu dosyaya kaydet ve çık")
+    parser.add_argument('--sure', type=float, default=60.0, help="Kayıt süresi (saniye)")
+    parser.add_argument('--market', default='SPOT', choices=sorted(STREAM_URLS))
+    parser.add_argument('--sembol', default='BTCUSDT')
+    parser.add_argument('--periyot', default='1m', choices=list(INTERVAL_MS))
+    parser.add_argument('--mum', type=int, default=30, help="Sentetik akıştaki mum sayısı")
+    args = parser.parse_args(argv)
+
+    if args.kaydet:
+        url = stream_url(STREAM_URLS[args.market], args.sembol, args.periyot)
+        count = record(url, args.kaydet, args.sure)
+        print(f"{count} çerçeve kaydedildi: {args.kaydet}")
+        return
+
+    if args.kayit:
+        frames = load_frames(args.kayit)
+    else:
+        frames = synthetic_frames(args.sembol, args.periyot, args.mum)
+    server, url = start_server(frames, args.port, args.hiz)
+    print(f"Sunucu çalışıyor: {url} ({len(frames)} çerçeve)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
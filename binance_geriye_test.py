@@ -0,0 +1,177 @@
+"""Sinyal kuralları için vektörel geriye dönük test.
+
+Kurallar (RSI 30/70, SMA-20 kesişimleri, Bollinger bant temasları, 2 kat
+hacim) tüm mum geçmişi üzerinde boolean maskeler olarak değerlendirilir;
+pozisyon, işlemler ve özkaynak eğrisi de döngüsüz hesaplanır:
+
+    python binance_geriye_test.py --sembol BTCUSDT --periyot 1h
+    python binance_geriye_test.py --sentetik 2000000
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from binance_onbellek import KlineCache
+
+# Alım/satım kuralları; update_signals'daki eşiklerle aynı
+BUY_RULES = ('rsi', 'sma', 'bollinger')
+SELL_RULES = ('rsi', 'sma', 'bollinger')
+
+
+def indicators(close, volume, window=20, rsi_window=14, bb_dev=2):
+    """ta ile aynı formüllerle (pandas kayan pencere/ewm) tüm seri için göstergeler."""
+    close = pd.Series(close, dtype=np.float64)
+    rolling = close.rolling(window, min_periods=window)
+    sma = rolling.mean()
+    std = rolling.std(ddof=0)
+    diff = close.diff(1)
+    up = diff.where(diff > 0, 0.0).ewm(alpha=1 / rsi_window, min_periods=rsi_window, adjust=False).mean()
+    down = (-diff.where(diff < 0, 0.0)).ewm(alpha=1 / rsi_window, min_periods=rsi_window,
+                                            adjust=False).mean()
+    rsi = np.where(down == 0, 100, 100 - (100 / (1 + up / down)))
+    volume_ma = pd.Series(volume, dtype=np.float64).rolling(window, min_periods=window).mean()
+    return {
+        'SMA20': sma.to_numpy(),
+        'RSI': rsi,
+        'BB_upper': (sma + bb_dev * std).to_numpy(),
+        'BB_lower': (sma - bb_dev * std).to_numpy(),
+        'volume_ma': volume_ma.to_numpy(),
+    }
+
+
+def signal_masks(close, volume, values, buy_rules=BUY_RULES, sell_rules=SELL_RULES,
+                 require_volume=False, rsi_low=30, rsi_high=70, volume_factor=2):
+    """Her mum için (alım, satım) boolean maskeleri."""
+    sma = values['SMA20']
+    above = close > sma
+    below = close < sma
+    # Kesişim: önceki mumda diğer taraftaydı (NaN karşılaştırmaları False verir)
+    previous_not_above = np.r_[False, ~above[:-1] & ~np.isnan(sma[:-1])]
+    previous_not_below = np.r_[False, ~below[:-1] & ~np.isnan(sma[:-1])]
+    with np.errstate(invalid='ignore'):
+        buy_masks = {
+            'rsi': values['RSI'] < rsi_low,
+            'sma': above & previous_not_above,
+            'bollinger': close <= values['BB_lower'],
+        }
+        sell_masks = {
+            'rsi': values['RSI'] > rsi_high,
+            'sma': below & previous_not_below,
+            'bollinger': close >= values['BB_upper'],
+        }
+        volume_spike = volume > volume_factor * values['volume_ma']
+
+    buy = np.zeros(len(close), dtype=bool)
+    sell = np.zeros(len(close), dtype=bool)
+    for rule in buy_rules:
+        buy |= buy_masks[rule]
+    for rule in sell_rules:
+        sell |= sell_masks[rule]
+    if require_volume:
+        buy &= volume_spike
+    return buy, sell
+
+
+def positions(buy, sell):
+    """Yalnızca uzun pozisyon: alım sinyalinden sonraki ilk satış sinyaline kadar 1."""
+    # Aynı mumda iki sinyal birden varsa yok sayılır
+    state = np.where(buy & ~sell, 1, np.where(sell & ~buy, -1, 0))
+    index = np.where(state != 0, np.arange(len(state)), 0)
+    np.maximum.accumulate(index, out=index)
+    return (state[index] == 1).astype(np.int8)
+
+
+def backtest(close, volume, fee=0.001, window=20, rsi_window=14, bb_dev=2, **rules):
+    """Kapanışta işlem yapıldığı varsayımıyla testi çalıştır; özet metrikler döndürür.
+
+    `fee` her alım ve satımda ödenen oransal komisyondur; gösterge pencereleri
+    ve `signal_masks` eşikleri anahtar kelimelerle değiştirilebilir.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    volume = np.asarray(volume, dtype=np.float64)
+    values = indicators(close, volume, window, rsi_window, bb_dev)
+    buy, sell = signal_masks(close, volume, values, **rules)
+    position = positions(buy, sell)
+    if len(position):
+        position[-1] = 0  # Açık pozisyon son mumda kapatılır
+
+    returns = np.zeros(len(close))
+    returns[1:] = close[1:] / close[:-1] - 1
+    change = np.diff(position, prepend=0)
+    # t mumunda alınan pozisyon t+1 getirisini kazanır; her yön değişimi komisyon öder
+    growth = (1 + np.r_[0.0, position[:-1] * returns[1:]]) * (1 - fee) ** np.abs(change)
+    equity = np.cumprod(growth)
+
+    entries = np.flatnonzero(change == 1)
+    exits = np.flatnonzero(change == -1)
+    trade_returns = close[exits] / close[entries] * (1 - fee) ** 2 - 1
+    peak = np.maximum.accumulate(equity) if len(equity) else equity
+    drawdown = equity / peak - 1 if len(equity) else equity
+
+    return {
+        'candles': len(close),
+        'trades': len(entries),
+        'pnl': float(equity[-1] - 1) if len(equity) else 0.0,
+        'buy_hold': float(close[-1] / close[0] - 1) if len(close) else 0.0,
+        'hit_rate': float((trade_returns > 0).mean()) if len(trade_returns) else 0.0,
+        'average_trade': float(trade_returns.mean()) if len(trade_returns) else 0.0,
+        'max_drawdown': float(drawdown.min()) if len(drawdown) else 0.0,
+        'exposure': float(position.mean()) if len(position) else 0.0,
+        'equity': equity,
+    }
+
+
+def format_report(result, title):
+    return "\n".join([
+        f"🧪 Geriye Dönük Test: {title}",
+        f"Mum sayısı: {result['candles']}, işlem sayısı: {result['trades']}",
+        f"Strateji getirisi: {result['pnl'] * 100:.2f}% (al ve tut: {result['buy_hold'] * 100:.2f}%)",
+        f"İsabet oranı: {result['hit_rate'] * 100:.1f}%, ortalama işlem: {result['average_trade'] * 100:.2f}%",
+        f"En büyük düşüş: {result['max_drawdown'] * 100:.2f}%, piyasada kalma: {result['exposure'] * 100:.1f}%",
+    ])
+
+
+def synthetic_candles(count, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, count)))
+    volume = rng.lognormal(0, 0.5, count)
+    return close, volume
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sinyal kuralları için geriye dönük test")
+    parser.add_argument('--market', default='SPOT', choices=['SPOT', 'FUTURES'])
+    parser.add_argument('--sembol', default='BTCUSDT')
+    parser.add_argument('--periyot', default='1h')
+    parser.add_argument('--komisyon', type=float, default=0.001, help="İşlem başına komisyon oranı")
+    parser.add_argument('--hacim', action='store_true', help="Alımlarda 2 kat hacim şartı ara")
+    parser.add_argument('--sentetik', type=int, help="Önbellek yerine bu kadar sentetik mum kullan")
+    args = parser.parse_args(argv)
+
+    if args.sentetik:
+        close, volume = synthetic_candles(args.sentetik)
+        title = f"sentetik ({args.sentetik} mum)"
+    else:
+        cache = KlineCache()
+        try:
+            close, volume = cache.load_columns(args.market, args.sembol, args.periyot, ('close', 'volume'))
+        finally:
+            cache.close()
+        title = f"{args.sembol} - {args.periyot}"
+        if len(close) == 0:
+            print(f"Önbellekte {title} için mum yok; önce BinanceAnalyzer ile çekin.")
+            return 1
+
+    start = time.perf_counter()
+    result = backtest(close, volume, args.komisyon, require_volume=args.hacim)
+    elapsed = time.perf_counter() - start
+    print(format_report(result, title))
+    print(f"Süre: {elapsed:.3f} sn")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
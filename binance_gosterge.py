@@ -0,0 +1,375 @@
+"""Mum başına sabit sürede güncellenen göstergeler (SMA, EMA, RSI, Bollinger).
+
+Hesaplamalar pandas'ın kayan pencere ve üstel ağırlıklı ortalama
+algoritmalarını (Kahan toplamı, Welford varyansı, ewm özyinelemesi) adım adım
+izler; böylece sonuçlar `ta` kütüphanesinin ürettiği değerlerle bit düzeyinde
+aynıdır. Karşılaştırma için:
+
+    python binance_gosterge.py --dogrula
+"""
+import argparse
+import math
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+NaN = float('nan')
+# pandas: yalnızca ~3 anlamlı basamak kalırsa hesap yeniden yapılır
+INV_COND_TOL = np.finfo(np.float64).eps * 1e3
+
+
+class RollingMean:
+    """`Series.rolling(window).mean()` ile aynı aritmetiği kullanan kayan ortalama."""
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()
+        self.nobs = 0
+        self.sum = 0.0
+        self.neg_ct = 0
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.same_count = 0  # Art arda gelen aynı değer sayısı
+        self.prev_value = None
+        self.saved = None
+
+    def push(self, value):
+        self.saved = (self.nobs, self.sum, self.neg_ct, self.compensation_add,
+                      self.compensation_remove, self.same_count, self.prev_value, None)
+        if len(self.values) == self.window:
+            removed = self.values.popleft()
+            self.saved = self.saved[:-1] + ((removed,),)
+            self._remove(removed)
+        self.values.append(value)
+        self._add(value)
+        return self.value()
+
+    def replace(self, value):
+        """Son eklenen değeri değiştir (henüz kapanmamış mumun güncellenmesi)."""
+        (self.nobs, self.sum, self.neg_ct, self.compensation_add, self.compensation_remove,
+         self.same_count, self.prev_value, removed) = self.saved
+        self.values.pop()
+        if removed is not None:
+            self.values.appendleft(removed[0])
+        return self.push(value)
+
+    def _add(self, value):
+        if self.prev_value is None:
+            self.prev_value = value
+        if value == value:
+            self.nobs += 1
+            y = value - self.compensation_add
+            t = self.sum + y
+            self.compensation_add = t - self.sum - y
+            self.sum = t
+            if math.copysign(1.0, value) < 0:
+                self.neg_ct += 1
+            if value == self.prev_value:
+                self.same_count += 1
+            else:
+                self.same_count = 1
+            self.prev_value = value
+
+    def _remove(self, value):
+        if value == value:
+            self.nobs -= 1
+            y = -value - self.compensation_remove
+            t = self.sum + y
+            self.compensation_remove = t - self.sum - y
+            self.sum = t
+            if math.copysign(1.0, value) < 0:
+                self.neg_ct -= 1
+
+    def value(self):
+        if self.nobs < self.window or self.nobs == 0:
+            return NaN
+        result = self.sum / self.nobs
+        if self.same_count >= self.nobs:
+            result = self.prev_value
+        elif self.neg_ct == 0 and result < 0:
+            result = 0.0
+        elif self.neg_ct == self.nobs and result > 0:
+            result = 0.0
+        return result
+
+
+class RollingStd:
+    """`Series.rolling(window).std(ddof)` ile aynı aritmetiği kullanan kayan standart sapma."""
+
+    def __init__(self, window, ddof=1):
+        self.window = window
+        self.ddof = ddof
+        self.values = deque()
+        self.nobs = 0.0
+        self.mean = 0.0
+        self.ssqdm = 0.0
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.unstable = False
+        self.saved = None
+
+    def push(self, value):
+        self.saved = (self.nobs, self.mean, self.ssqdm, self.compensation_add,
+                      self.compensation_remove, self.unstable, None)
+        if len(self.values) == self.window:
+            removed = self.values.popleft()
+            self.saved = self.saved[:-1] + ((removed,),)
+            self._remove(removed)
+        self.values.append(value)
+        self._add(value)
+        if self.unstable:
+            # Sayısal olarak kararsız hale geldiyse pencere baştan toplanır
+            self.nobs = self.mean = self.ssqdm = 0.0
+            self.compensation_add = self.compensation_remove = 0.0
+            for item in self.values:
+                self._add(item)
+            self.unstable = False
+        return self.value()
+
+    def replace(self, value):
+        """Son eklenen değeri değiştir (henüz kapanmamış mumun güncellenmesi)."""
+        (self.nobs, self.mean, self.ssqdm, self.compensation_add, self.compensation_remove,
+         self.unstable, removed) = self.saved
+        self.values.pop()
+        if removed is not None:
+            self.values.appendleft(removed[0])
+        return self.push(value)
+
+    def _add(self, value):
+        if value != value:
+            return
+        prev_m2 = self.ssqdm
+        self.nobs += 1
+        prev_mean = self.mean - self.compensation_add
+        y = value - self.compensation_add
+        t = y - self.mean
+        self.compensation_add = t + self.mean - y
+        self.mean = self.mean + t / self.nobs
+        self.ssqdm = self.ssqdm + (value - prev_mean) * (value - self.mean)
+        if prev_m2 * INV_COND_TOL > self.ssqdm:
+            self.unstable = True
+
+    def _remove(self, value):
+        if value != value:
+            return
+        prev_m2 = self.ssqdm
+        self.nobs -= 1
+        if self.nobs:
+            prev_mean = self.mean - self.compensation_remove
+            y = value - self.compensation_remove
+            t = y - self.mean
+            self.compensation_remove = t + self.mean - y
+            self.mean = self.mean - t / self.nobs
+            self.ssqdm = self.ssqdm - (value - prev_mean) * (value - self.mean)
+            if prev_m2 * INV_COND_TOL > self.ssqdm:
+                self.unstable = True
+        else:
+            self.mean = 0.0
+            self.ssqdm = 0.0
+            self.unstable = False
+
+    def value(self):
+        if self.nobs < max(self.window, 1) or self.nobs <= self.ddof:
+            return NaN
+        variance = self.ssqdm / (self.nobs - self.ddof)
+        return math.sqrt(variance) if variance >= 0 else 0.0
+
+
+class EWM:
+    """`Series.ewm(com=..., adjust=False).mean()` ile aynı özyinelemeli ortalama."""
+
+    def __init__(self, com, min_periods=0):
+        self.com = com
+        self.min_periods = min_periods
+        alpha = 1. / (1. + com)
+        self.old_wt_factor = 1. - alpha
+        self.new_wt = alpha
+        self.weighted = None
+        self.old_wt = 1.
+        self.nobs = 0
+        self.saved = None
+
+    def push(self, value):
+        self.saved = (self.weighted, self.old_wt, self.new_wt, self.nobs)
+        is_observation = value == value
+        if self.weighted is None:
+            self.weighted = value
+            self.nobs = int(is_observation)
+        else:
+            self.nobs += is_observation
+            weighted = self.weighted
+            if weighted == weighted:
+                self.old_wt *= self.old_wt_factor
+                if is_observation:
+                    # Sabit serilerde sayısal hata birikmesin
+                    if weighted != value:
+                        if self.com == 1:
+                            self.new_wt = 1. - self.old_wt
+                        weighted = self.old_wt * weighted + self.new_wt * value
+                        weighted /= (self.old_wt + self.new_wt)
+                    self.old_wt = 1.
+            elif is_observation:
+                weighted = value
+            self.weighted = weighted
+        return self.value()
+
+    def replace(self, value):
+        """Son eklenen değeri değiştir (henüz kapanmamış mumun güncellenmesi)."""
+        self.weighted, self.old_wt, self.new_wt, self.nobs = self.saved
+        return self.push(value)
+
+    def value(self):
+        return self.weighted if self.nobs >= self.min_periods else NaN
+
+
+def span_com(span):
+    return float((span - 1) / 2)
+
+
+def alpha_com(alpha):
+    return float((1 - alpha) / alpha)
+
+
+class RSI:
+    """Wilder RSI; `ta.momentum.RSIIndicator` ile aynı hesap."""
+
+    def __init__(self, window=14):
+        com = alpha_com(1 / window)
+        self.up = EWM(com, window)
+        self.down = EWM(com, window)
+        self.previous = None
+        self.saved = None
+
+    def push(self, close):
+        self.saved = self.previous
+        diff = close - self.previous if self.previous is not None else NaN
+        self.previous = close
+        up = self.up.push(diff if diff > 0 else 0.0)
+        down = self.down.push(-(diff if diff < 0 else 0.0))
+        return self.value(up, down)
+
+    def replace(self, close):
+        """Son eklenen kapanışı değiştir (henüz kapanmamış mumun güncellenmesi)."""
+        previous = self.saved
+        diff = close - previous if previous is not None else NaN
+        self.previous = close
+        up = self.up.replace(diff if diff > 0 else 0.0)
+        down = self.down.replace(-(diff if diff < 0 else 0.0))
+        return self.value(up, down)
+
+    @staticmethod
+    def value(up, down):
+        if down == 0:
+            return 100.0
+        return 100 - (100 / (1 + up / down))
+
+
+class IndicatorEngine:
+    """Grafik ve sinyallerin kullandığı göstergeleri mum başına O(1) güncelleyen motor.
+
+    `push` yeni (kapanmış ya da yeni açılan) mumu ekler, `replace` son mumun
+    kapanışını günceller; ikisi de `COLUMNS` sırasıyla değerleri döndürür.
+    """
+    COLUMNS = ('SMA20', 'EMA20', 'RSI', 'BB_upper', 'BB_lower')
+
+    def __init__(self, sma_window=20, ema_window=20, rsi_window=14, bb_window=20, bb_dev=2):
+        self.bb_dev = bb_dev
+        self.sma = RollingMean(sma_window)
+        self.ema = EWM(span_com(ema_window), ema_window)
+        self.rsi = RSI(rsi_window)
+        self.bb_mean = RollingMean(bb_window)
+        self.bb_std = RollingStd(bb_window, ddof=0)
+
+    def _bands(self, mean, std):
+        return mean + self.bb_dev * std, mean - self.bb_dev * std
+
+    def push(self, close):
+        close = float(close)
+        mean = self.bb_mean.push(close)
+        return (self.sma.push(close), self.ema.push(close), self.rsi.push(close),
+                *self._bands(mean, self.bb_std.push(close)))
+
+    def replace(self, close):
+        close = float(close)
+        mean = self.bb_mean.replace(close)
+        return (self.sma.replace(close), self.ema.replace(close), self.rsi.replace(close),
+                *self._bands(mean, self.bb_std.replace(close)))
+
+    def extend(self, closes):
+        """Kapanış dizisini sırayla ekle; (n, len(COLUMNS)) boyutlu dizi döndürür."""
+        return np.array([self.push(close) for close in np.asarray(closes, dtype=np.float64).tolist()],
+                        dtype=np.float64).reshape(-1, len(self.COLUMNS))
+
+
+def ta_indicators(closes):
+    """Aynı göstergelerin `ta` ile hesaplanmış hali (karşılaştırma için)."""
+    import pandas as pd
+    from ta.momentum import RSIIndicator
+    from ta.trend import EMAIndicator, SMAIndicator
+    from ta.volatility import BollingerBands
+
+    close = pd.Series(closes, dtype=np.float64)
+    bollinger = BollingerBands(close=close, window=20)
+    return np.column_stack([
+        SMAIndicator(close=close, window=20).sma_indicator(),
+        EMAIndicator(close=close, window=20).ema_indicator(),
+        RSIIndicator(close=close, window=14).rsi(),
+        bollinger.bollinger_hband(),
+        bollinger.bollinger_lband(),
+    ])
+
+
+def sample_closes(count, seed):
+    """Sabit bölümler ve tekrar eden değerler içeren sentetik kapanış serisi."""
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, count)))
+    closes = np.round(closes, 2)
+    flat = rng.integers(0, max(1, count - 50))
+    closes[flat:flat + 40] = closes[flat]
+    return closes
+
+
+def verify(count=5000, seeds=5):
+    """Motoru `ta` ile karşılaştır; bit düzeyinde farklı değer sayısını döndür."""
+    mismatches = 0
+    for seed in range(seeds):
+        closes = sample_closes(count, seed)
+        expected = ta_indicators(closes)
+        actual = IndicatorEngine().extend(closes)
+        # Açık mum güncellemeleri: her mum önce farklı bir değerle eklenip sonra düzeltilir
+        engine = IndicatorEngine()
+        replaced = []
+        for close in closes.tolist():
+            engine.push(close * 1.01)
+            replaced.append(engine.replace(close))
+        for name, values in (('push', actual), ('replace', np.array(replaced))):
+            different = ~((expected.view(np.int64) == values.view(np.int64))
+                          | (np.isnan(expected) & np.isnan(values)))
+            count_diff = int(different.sum())
+            mismatches += count_diff
+            print(f"tohum {seed} {name:>7}: {count_diff} farklı değer "
+                  f"(en büyük fark {np.nanmax(np.abs(expected - values)):.3g})")
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Artımlı gösterge motoru")
+    parser.add_argument('--dogrula', action='store_true', help="Sonuçları ta ile karşılaştır")
+    parser.add_argument('--mum', type=int, default=5000, help="Seri uzunluğu")
+    args = parser.parse_args(argv)
+
+    closes = sample_closes(args.mum, 0)
+    engine = IndicatorEngine()
+    start = time.perf_counter()
+    engine.extend(closes)
+    elapsed = time.perf_counter() - start
+    print(f"Mum başına güncelleme: {elapsed / len(closes) * 1e6:.2f} µs")
+    if args.dogrula:
+        return 1 if verify(args.mum) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
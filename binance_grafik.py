@@ -0,0 +1,136 @@
+import numpy as np
+import pyqtgraph as pg
+from PyQt5 import QtCore, QtGui
+
+UP_COLOR = '#00ff00'    # Yeşil mum
+DOWN_COLOR = '#ff0000'  # Kırmızı mum
+
+
+def wick_path(x, low, high):
+    xs = np.repeat(x, 2)
+    ys = np.column_stack([low, high]).ravel()
+    return pg.arrayToQPath(xs, ys, connect='pairs', finiteCheck=False)
+
+
+def body_rects(x, half_width, open, close):
+    # Tek bir yolun çok sayıda alt yolla doldurulması Qt'de çok yavaş olduğundan
+    # gövdeler dikdörtgen listesi olarak çizilir (sayıları piksel genişliğiyle sınırlı)
+    left = (x - half_width).tolist()
+    bottom = np.minimum(open, close).tolist()
+    height = np.abs(close - open).tolist()
+    width = 2 * half_width
+    return [QtCore.QRectF(l, b, width, h) for l, b, h in zip(left, bottom, height)]
+
+
+class CandlestickItem(pg.GraphicsObject):
+    """Tüm mumları NumPy dizilerinden tek seferde çizen grafik öğesi.
+
+    Görünür aralık (iki yanında birer ekran genişliği payla) bir QPicture'a
+    çizilip önbelleklenir; kaydırma bu pay içinde kaldıkça yeniden çizim
+    gerekmez. Bir piksele birden fazla mum düştüğünde mumlar piksel başına
+    birleştirilir (açılış/en yüksek/en düşük/kapanış), böylece çizilen
+    öğe sayısı mum sayısından bağımsız kalır.
+    """
+
+    def __init__(self, width=0.8):
+        super().__init__()
+        self.width = width
+        self.picture = None
+        self.picture_key = None
+        self.set_data(np.empty(0), np.empty(0), np.empty(0), np.empty(0), np.empty(0))
+
+    def set_data(self, x, open, high, low, close):
+        self.x = np.asarray(x, dtype=float)
+        self.open = np.asarray(open, dtype=float)
+        self.high = np.asarray(high, dtype=float)
+        self.low = np.asarray(low, dtype=float)
+        self.close = np.asarray(close, dtype=float)
+        self.spacing = float(np.median(np.diff(self.x))) if len(self.x) > 1 else 1.0
+        if len(self.x):
+            self.bounds = QtCore.QRectF(
+                self.x[0] - self.spacing / 2, np.nanmin(self.low),
+                self.x[-1] - self.x[0] + self.spacing,
+                np.nanmax(self.high) - np.nanmin(self.low)
+            )
+        else:
+            self.bounds = QtCore.QRectF()
+        self.picture = None
+        self.picture_key = None
+        self.prepareGeometryChange()
+        self.informViewBoundsChanged()
+        self.update()
+
+    def level_of_detail(self):
+        """Çizilecek (başlangıç, bitiş, birleştirme adımı) üçlüsü."""
+        count = len(self.x)
+        view = self.viewRect()
+        pixel = self.pixelWidth()
+        if view is None or not pixel:
+            return 0, count, 1
+        # Piksel başına düşen mum sayısı; ikinin kuvvetine yuvarlanır ki
+        # küçük yakınlaştırmalar yeniden çizim gerektirmesin
+        step = max(1, int(pixel / self.spacing))
+        step = 1 << (step - 1).bit_length()
+        visible = max(step, int(view.width() / self.spacing))
+        start = np.searchsorted(self.x, view.left()) - visible
+        end = np.searchsorted(self.x, view.right()) + visible
+        # Sınırlar görünür uzunluğun katlarına hizalanır (kaydırmada aynı anahtar)
+        chunk = 1 << (visible - 1).bit_length()
+        start = max(0, start // chunk * chunk)
+        end = min(count, -(-end // chunk) * chunk)
+        # Birleştirme kovaları indekse göre sabit kalsın
+        start -= start % step
+        return int(start), int(end), step
+
+    def aggregate(self, start, end, step):
+        x = self.x[start:end]
+        open = self.open[start:end]
+        high = self.high[start:end]
+        low = self.low[start:end]
+        close = self.close[start:end]
+        if step == 1 or not len(x):
+            return x, open, high, low, close, self.spacing * self.width / 2
+        edges = np.arange(0, len(x), step)
+        last = np.minimum(edges + step, len(x)) - 1
+        return (
+            (x[edges] + x[last]) / 2,
+            open[edges],
+            np.fmax.reduceat(high, edges),
+            np.fmin.reduceat(low, edges),
+            close[last],
+            step * self.spacing * self.width / 2,
+        )
+
+    def render(self, start, end, step):
+        x, open, high, low, close, half_width = self.aggregate(start, end, step)
+        valid = np.isfinite(open) & np.isfinite(high) & np.isfinite(low) & np.isfinite(close)
+        picture = QtGui.QPicture()
+        painter = QtGui.QPainter(picture)
+        for color, mask in ((UP_COLOR, valid & (close >= open)), (DOWN_COLOR, valid & (close < open))):
+            if not mask.any():
+                continue
+            pen = pg.mkPen(color, width=1)
+            pen.setCosmetic(True)
+            painter.setPen(pen)
+            # Fitiller yalnızca çizgidir; fırça açıkken yol dolgusu gereksiz yere hesaplanır
+            painter.setBrush(QtCore.Qt.NoBrush)
+            painter.drawPath(wick_path(x[mask], low[mask], high[mask]))
+            painter.setBrush(pg.mkBrush(color))
+            painter.drawRects(body_rects(x[mask], half_width, open[mask], close[mask]))
+        painter.end()
+        return picture
+
+    def paint(self, painter, option, widget=None):
+        if not len(self.x):
+            return
+        key = self.level_of_detail()
+        if key != self.picture_key:
+            self.picture = self.render(*key)
+            self.picture_key = key
+        self.picture.play(painter)
+
+    def viewRangeChanged(self):
+        self.update()
+
+    def boundingRect(self):
+        return QtCore.QRectF(self.bounds)
@@ -0,0 +1,165 @@
+"""Binance REST istekleri için merkezi, ağırlık sınırlı zamanlayıcı.
+
+Tüm mum ve borsa bilgisi istekleri market başına tek bir zamanlayıcıdan
+geçer. Her istek hem marketin toplam dakikalık bütçesinden hem de kendi uç
+noktasının kovasından ağırlık alır; bütçe yetmezse istek hata almak yerine
+sıraya girer. Sırada etkileşimli istekler (kullanıcının seçimi, Yenile)
+arka plan isteklerinin (zamanlayıcı, tarayıcı) önüne geçer. Her yanıttaki
+X-MBX-USED-WEIGHT-1M başlığıyla yerel kova sunucunun sayacına eşitlenir;
+429/418 yanıtlarında Retry-After süresince tüm istekler bekletilir.
+"""
+import heapq
+import itertools
+import threading
+import time
+
+# Öncelikler: küçük değer önce çalışır
+INTERACTIVE = 0
+BACKGROUND = 1
+
+# Dakikalık ağırlık bütçesi; Binance sınırının altında tutulur
+WEIGHT_PER_MINUTE = {'SPOT': 3000, 'FUTURES': 1200}
+
+# Uç noktaların toplam bütçeden alabileceği en büyük pay; biri diğerini tüketemez
+ENDPOINT_SHARES = {'klines': 0.9, 'exchange_info': 0.2}
+
+# exchangeInfo ağırlığı marketten markete değişir
+EXCHANGE_INFO_WEIGHT = {'SPOT': 20, 'FUTURES': 1}
+
+
+def kline_weight(limit):
+    """Mum isteğinin ağırlığı (istenen mum sayısına göre)."""
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+def used_weight(response):
+    """Yanıttaki kullanılmış dakikalık ağırlık; başlık yoksa None."""
+    if response is None:
+        return None
+    value = response.headers.get('X-MBX-USED-WEIGHT-1M') or response.headers.get('X-MBX-USED-WEIGHT')
+    return int(value) if value is not None else None
+
+
+class TokenBucket:
+    """Dakikalık bütçeyi sürekli dolan kova; kilitleme zamanlayıcıya aittir."""
+
+    def __init__(self, per_minute):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, weight):
+        """`weight` için beklenecek süre (saniye); hemen alınabiliyorsa 0."""
+        return max(0.0, (min(weight, self.capacity) - self.tokens) / self.rate)
+
+    def take(self, weight):
+        self.tokens -= min(weight, self.capacity)
+
+
+class RequestScheduler:
+    """Bir marketin istek ağırlığını uç nokta kovaları ve öncelik sırasıyla paylaştırır.
+
+    Sıranın başındaki istek (önce öncelik, sonra geliş sırası) ağırlık
+    yetene kadar bekler; arkasındakiler onu geçemez.
+    """
+
+    def __init__(self, per_minute, endpoint_shares=ENDPOINT_SHARES):
+        self.total = TokenBucket(per_minute)
+        self.endpoints = {name: TokenBucket(per_minute * share) for name, share in endpoint_shares.items()}
+        self.condition = threading.Condition()
+        self.queue = []  # (öncelik, sıra no)
+        self.counter = itertools.count()
+        self.paused_until = 0.0
+        self.used_weight = 0  # Sunucunun son bildirdiği değer
+
+    def acquire(self, endpoint, weight, priority=INTERACTIVE, cancelled=None):
+        """Ağırlığı al; `cancelled` True dönerse beklemeyi bırakıp False döndür."""
+        ticket = (priority, next(self.counter))
+        buckets = (self.total, self.endpoints[endpoint])
+        with self.condition:
+            heapq.heappush(self.queue, ticket)
+            try:
+                while True:
+                    if cancelled and cancelled():
+                        return False
+                    wait = None
+                    if self.queue[0] == ticket:
+                        now = time.monotonic()
+                        for bucket in buckets:
+                            bucket.refill(now)
+                        wait = max([self.paused_until - now] + [bucket.wait_time(weight) for bucket in buckets])
+                        if wait <= 0:
+                            for bucket in buckets:
+                                bucket.take(weight)
+                            return True
+                    # İptal kontrolü için bekleme kısa dilimlerle yapılır
+                    self.condition.wait(0.5 if wait is None else min(wait, 0.5))
+            finally:
+                self.queue.remove(ticket)
+                heapq.heapify(self.queue)
+                self.condition.notify_all()
+
+    def update(self, used):
+        """Sunucunun sayacı yerel kovadan yüksekse kovayı ona göre boşalt."""
+        with self.condition:
+            self.used_weight = used
+            self.total.tokens = min(self.total.tokens, self.total.capacity - used)
+
+    def pause(self, seconds):
+        """429/418 sonrası tüm istekleri `seconds` saniye beklet."""
+        with self.condition:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.condition.notify_all()
+
+    def call(self, client, endpoint, weight, request, priority=INTERACTIVE, cancelled=None, retries=3):
+        """`request()`i sırası gelince çalıştır; iptal edilirse None döner."""
+        for attempt in range(retries + 1):
+            if not self.acquire(endpoint, weight, priority, cancelled):
+                return None
+            try:
+                return request()
+            except Exception as e:
+                # BinanceAPIException: 429 sınır aşıldı, 418 IP geçici olarak engellendi
+                if getattr(e, 'status_code', None) not in (418, 429) or attempt == retries:
+                    raise
+                self.pause(float(e.response.headers.get('Retry-After', 60)))
+            finally:
+                used = used_weight(getattr(client, 'response', None))
+                if used is not None:
+                    self.update(used)
+
+
+# Market başına tek zamanlayıcı; tüm thread'ler ve istemciler bunu paylaşır
+SCHEDULERS = {market: RequestScheduler(weight) for market, weight in WEIGHT_PER_MINUTE.items()}
+
+
+def fetch_klines(client, market_type, priority=INTERACTIVE, cancelled=None, **params):
+    def request():
+        if market_type == 'SPOT':
+            return client.get_klines(**params)
+        return client.futures_klines(**params)
+
+    weight = kline_weight(params.get('limit', 500))
+    return SCHEDULERS[market_type].call(client, 'klines', weight, request, priority, cancelled)
+
+
+def fetch_exchange_info(client, market_type, priority=INTERACTIVE):
+    def request():
+        if market_type == 'SPOT':
+            return client.get_exchange_info()
+        return client.futures_exchange_info()
+
+    return SCHEDULERS[market_type].call(client, 'exchange_info', EXCHANGE_INFO_WEIGHT[market_type],
+                                        request, priority)
+
@@ -0,0 +1,165 @@
+"""Binance REST uç noktalarının yerel taklidi.
+
+exchangeInfo ve klines isteklerine sentetik verilerle yanıt verir. Her
+yanıtta gerçek borsadaki gibi X-MBX-USED-WEIGHT-1M başlığı döner; dakikalık
+sınır aşılırsa 429 ve Retry-After gönderilir. İstek zamanlayıcısını canlı
+borsaya yüklenmeden denemek için kullanılır:
+
+    python binance_istek_sunucu.py --port 8765 --sinir 600
+    python binance.py --rest-url http://127.0.0.1:8765
+"""
+import argparse
+import json
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from binance_istek import EXCHANGE_INFO_WEIGHT, kline_weight
+from binance_onbellek import INTERVAL_MS, PAGE_LIMIT
+
+SYMBOLS = ['BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'SOLUSDT', 'XRPUSDT', 'ADAUSDT', 'ETHBTC', 'BNBBTC']
+
+# Yol -> (market, uç nokta)
+ROUTES = {
+    '/api/v3/ping': ('SPOT', 'ping'),
+    '/api/v3/exchangeInfo': ('SPOT', 'exchange_info'),
+    '/api/v3/klines': ('SPOT', 'klines'),
+    '/fapi/v1/ping': ('FUTURES', 'ping'),
+    '/fapi/v1/exchangeInfo': ('FUTURES', 'exchange_info'),
+    '/fapi/v1/klines': ('FUTURES', 'klines'),
+}
+
+
+class WeightCounter:
+    """Binance gibi dakika başında sıfırlanan kullanılmış ağırlık sayacı."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.minute = None
+        self.used = 0
+        self.lock = threading.Lock()
+
+    def add(self, weight):
+        """Ağırlığı ekle; (kullanılan, sınır aşıldıysa kalan saniye) döner."""
+        with self.lock:
+            now = time.time()
+            minute = int(now // 60)
+            if minute != self.minute:
+                self.minute, self.used = minute, 0
+            self.used += weight
+            retry = math.ceil(60 - now % 60) if self.used > self.limit else None
+            return self.used, retry
+
+
+def exchange_info(market):
+    symbols = []
+    for symbol in SYMBOLS:
+        quote = 'USDT' if symbol.endswith('USDT') else 'BTC'
+        if market == 'FUTURES' and quote != 'USDT':
+            continue
+        symbols.append({'symbol': symbol, 'status': 'TRADING', 'baseAsset': symbol[:-len(quote)],
+                        'quoteAsset': quote})
+    return {'timezone': 'UTC', 'serverTime': int(time.time() * 1000), 'symbols': symbols}
+
+
+def synthetic_klines(symbol, interval, start=None, end=None, limit=500):
+    """Açılış zamanına bağlı, her istekte aynı çıkan sentetik mumlar."""
+    step = INTERVAL_MS[interval]
+    now = int(time.time() * 1000) // step * step
+    if start is not None:
+        first = -(-start // step) * step
+        last = min(now, first + (limit - 1) * step)
+    else:
+        last = min(now, end // step * step) if end is not None else now
+        first = last - (limit - 1) * step
+    base = 10 + sum(map(ord, symbol)) % 90
+    klines = []
+    for open_time in range(first, last + 1, step):
+        phase = open_time / step
+        open = base * (1 + 0.05 * math.sin(phase / 50))
+        close = base * (1 + 0.05 * math.sin((phase + 1) / 50))
+        high = max(open, close) * 1.002
+        low = min(open, close) * 0.998
+        volume = 100 + 50 * math.sin(phase / 7) ** 2
+        klines.append([
+            open_time, f'{open:.4f}', f'{high:.4f}', f'{low:.4f}', f'{close:.4f}', f'{volume:.3f}',
+            open_time + step - 1, f'{volume * close:.2f}', 100, f'{volume / 2:.3f}',
+            f'{volume * close / 2:.2f}', '0'
+        ])
+    return klines
+
+
+def make_handler(counters, latency):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path not in ROUTES:
+                return self.reply(404, {'code': -1, 'msg': 'Bilinmeyen uç nokta'})
+            market, endpoint = ROUTES[url.path]
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            limit = min(int(query.get('limit', 500)), PAGE_LIMIT)
+            weight = {'ping': 1, 'exchange_info': EXCHANGE_INFO_WEIGHT[market],
+                      'klines': kline_weight(limit)}[endpoint]
+            used, retry = counters[market].add(weight)
+            headers = {'X-MBX-USED-WEIGHT-1M': str(used)}
+            if retry is not None:
+                headers['Retry-After'] = str(retry)
+                return self.reply(429, {'code': -1003, 'msg': 'Too many requests'}, headers)
+            if latency:
+                time.sleep(latency)
+            if endpoint == 'ping':
+                body = {}
+            elif endpoint == 'exchange_info':
+                body = exchange_info(market)
+            else:
+                body = synthetic_klines(
+                    query['symbol'], query['interval'],
+                    int(query['startTime']) if 'startTime' in query else None,
+                    int(query['endTime']) if 'endTime' in query else None, limit
+                )
+            self.reply(200, body, headers)
+
+        def reply(self, status, body, headers=None):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass  # Her istek için konsola yazılmaz
+
+    return Handler
+
+
+def start_server(port=0, limit=6000, latency=0.0):
+    """Sunucuyu arka planda başlat; (sunucu, temel adres) döndürür. port=0 boş port seçer."""
+    counters = {'SPOT': WeightCounter(limit), 'FUTURES': WeightCounter(limit)}
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(counters, latency))
+    server.counters = counters
+    threading.Thread(target=server.serve_forever, name='MockRestServer', daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yerel Binance REST sunucusu")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--sinir', type=int, default=6000, help="Dakikalık ağırlık sınırı")
+    parser.add_argument('--gecikme', type=float, default=0.0, help="Yanıt gecikmesi (saniye)")
+    args = parser.parse_args(argv)
+
+    server, url = start_server(args.port, args.sinir, args.gecikme)
+    print(f"Sunucu çalışıyor: {url} (dakikalık sınır {args.sinir})")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
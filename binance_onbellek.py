@@ -0,0 +1,215 @@
+import os
+import sqlite3
+import time
+
+import numpy as np
+import pandas as pd
+
+from binance_istek import INTERACTIVE, fetch_klines
+
+CACHE_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'binance_mumlar.db')
+
+# Periyotların milisaniye karşılığı
+INTERVAL_MS = {
+    '1m': 60 * 1000,
+    '5m': 5 * 60 * 1000,
+    '15m': 15 * 60 * 1000,
+    '1h': 60 * 60 * 1000,
+    '4h': 4 * 60 * 60 * 1000,
+    '1d': 24 * 60 * 60 * 1000,
+}
+
+# Binance'in tek istekte döndürdüğü en fazla mum sayısı
+PAGE_LIMIT = 1000
+
+KLINE_COLUMNS = [
+    'timestamp', 'open', 'high', 'low', 'close', 'volume',
+    'close_time', 'quote_volume', 'trades', 'taker_buy_base',
+    'taker_buy_quote', 'ignore'
+]
+
+# Tipli mum satırı; kullanılmayan 'ignore' sütunu taşınmaz
+KLINE_DTYPE = np.dtype([
+    ('timestamp', np.int64), ('open', np.float64), ('high', np.float64), ('low', np.float64),
+    ('close', np.float64), ('volume', np.float64), ('close_time', np.int64),
+    ('quote_volume', np.float64), ('trades', np.int32), ('taker_buy_base', np.float64),
+    ('taker_buy_quote', np.float64),
+])
+
+
+def parse_klines(klines):
+    """Mum satırlarını (REST'in dizge listeleri ya da önbellek demetleri) yapılı diziye çevir.
+
+    Her sütun tek seferde dönüştürülür; zaten tipli bir dizi geldiyse olduğu gibi döner.
+    """
+    if isinstance(klines, np.ndarray) and klines.dtype == KLINE_DTYPE:
+        return klines
+    data = np.empty(len(klines), dtype=KLINE_DTYPE)
+    if len(klines):
+        for name, column in zip(KLINE_DTYPE.names, zip(*klines)):
+            data[name] = np.array(column, dtype=KLINE_DTYPE[name])
+    return data
+
+
+def kline_frame(klines):
+    """Tüm sütunları tipli, açılış zamanı indeksli mum DataFrame'i."""
+    data = parse_klines(klines)
+    df = pd.DataFrame(data[list(KLINE_DTYPE.names[1:])])
+    df.index = pd.DatetimeIndex(data['timestamp'].astype('datetime64[ms]'), name='timestamp')
+    return df
+
+
+class KlineCache:
+    """(market, sembol, periyot) başına mumları saklayan SQLite önbelleği.
+
+    Yenilemelerde yalnızca son önbelleklenen mumdan sonrası istenir; daha eski
+    geçmiş gerektiğinde sayfalı isteklerle geriye doğru doldurulur.
+    """
+
+    def __init__(self, db_path=CACHE_DB):
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.create_tables()
+
+    def create_tables(self):
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS klines (
+                market TEXT NOT NULL,
+                symbol TEXT NOT NULL,
+                interval TEXT NOT NULL,
+                open_time INTEGER NOT NULL,
+                open REAL, high REAL, low REAL, close REAL, volume REAL,
+                close_time INTEGER, quote_volume REAL, trades INTEGER,
+                taker_buy_base REAL, taker_buy_quote REAL,
+                PRIMARY KEY (market, symbol, interval, open_time)
+            ) WITHOUT ROWID
+        ''')
+        # Daha eski verisi olmadığı anlaşılan seriler; geriye doldurma tekrar denenmez
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS exhausted_history (
+                market TEXT NOT NULL,
+                symbol TEXT NOT NULL,
+                interval TEXT NOT NULL,
+                PRIMARY KEY (market, symbol, interval)
+            ) WITHOUT ROWID
+        ''')
+        self.conn.commit()
+
+    def history_exhausted(self, market, symbol, interval):
+        return self.conn.execute(
+            'SELECT 1 FROM exhausted_history WHERE market = ? AND symbol = ? AND interval = ?',
+            (market, symbol, interval)
+        ).fetchone() is not None
+
+    def mark_history_exhausted(self, market, symbol, interval):
+        self.conn.execute('INSERT OR IGNORE INTO exhausted_history VALUES (?, ?, ?)',
+                          (market, symbol, interval))
+        self.conn.commit()
+
+    def bounds(self, market, symbol, interval):
+        return self.conn.execute(
+            'SELECT MIN(open_time), MAX(open_time), COUNT(*) FROM klines '
+            'WHERE market = ? AND symbol = ? AND interval = ?',
+            (market, symbol, interval)
+        ).fetchone()
+
+    def store(self, market, symbol, interval, klines):
+        # Açık (henüz kapanmamış) son mum sonraki yenilemede üzerine yazılır
+        rows = [
+            (market, symbol, interval, int(k[0]), float(k[1]), float(k[2]), float(k[3]),
+             float(k[4]), float(k[5]), int(k[6]), float(k[7]), int(k[8]), float(k[9]),
+             float(k[10]))
+            for k in klines
+        ]
+        self.conn.executemany(
+            'INSERT OR REPLACE INTO klines VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows
+        )
+        self.conn.commit()
+
+    def load(self, market, symbol, interval, limit):
+        """Son `limit` mum, eskiden yeniye sıralı KLINE_DTYPE dizisi olarak."""
+        rows = self.conn.execute(
+            'SELECT open_time, open, high, low, close, volume, close_time, quote_volume, '
+            'trades, taker_buy_base, taker_buy_quote FROM klines '
+            'WHERE market = ? AND symbol = ? AND interval = ? '
+            'ORDER BY open_time DESC LIMIT ?',
+            (market, symbol, interval, limit)
+        ).fetchall()
+        return np.array(rows[::-1], dtype=KLINE_DTYPE)
+
+    def load_columns(self, market, symbol, interval, columns, limit=None):
+        """İstenen sütunları açılış zamanına göre sıralı NumPy dizileri olarak döndür."""
+        unknown = set(columns) - set(KLINE_COLUMNS[1:-1]) - {'open_time'}
+        if unknown:
+            raise ValueError(f"Bilinmeyen sütun: {', '.join(sorted(unknown))}")
+        names = ', '.join(columns)
+        where = 'WHERE market = ? AND symbol = ? AND interval = ?'
+        params = (market, symbol, interval)
+        if limit is None:
+            query = f'SELECT {names} FROM klines {where} ORDER BY open_time'
+        else:
+            # Son `limit` mum, yine eskiden yeniye sıralı
+            query = (f'SELECT {names} FROM (SELECT open_time AS t, {names} FROM klines {where} '
+                     'ORDER BY open_time DESC LIMIT ?) ORDER BY t')
+            params += (limit,)
+        rows = np.array(self.conn.execute(query, params).fetchall(), dtype=np.float64)
+        rows = rows.reshape(-1, len(columns))
+        return tuple(rows[:, i] for i in range(len(columns)))
+
+    def sync(self, client, market, symbol, interval, limit=500, cancelled=None, priority=INTERACTIVE):
+        """Önbelleği güncelleyip son `limit` mumu döndür; yapılan istek sayısı da döner.
+
+        `cancelled` verilirse her sayfadan önce (ve istek sırada beklerken)
+        çağrılır; True dönerse kalan sayfalar istenmez (istek eskimiştir,
+        sonuç zaten kullanılmayacaktır). `priority` istek zamanlayıcısındaki
+        sırayı belirler.
+        """
+        step = INTERVAL_MS[interval]
+        now = int(time.time() * 1000)
+        first, last, count = self.bounds(market, symbol, interval)
+        requests = 0
+
+        if last is None:
+            # İlk kez: son `limit` mumun başından itibaren ileri doğru çekilir
+            start = now - step * limit
+        else:
+            # Son mum açık olabileceği için ondan itibaren yeniden çekilir; önbellek
+            # uzun süre güncellenmediyse aradaki boşluk da sayfalarla doldurulur
+            start = last
+        while start <= now and not (cancelled and cancelled()):
+            # Ağırlık istenen mum sayısına göre ölçülür; yalnızca eksik mumlar istenir
+            page_limit = min(PAGE_LIMIT, (now - start) // step + 1)
+            klines = fetch_klines(client, market, priority, cancelled, symbol=symbol, interval=interval,
+                                  startTime=start, limit=page_limit)
+            requests += 1
+            if not klines:
+                break
+            self.store(market, symbol, interval, klines)
+            if len(klines) < page_limit:
+                break
+            start = int(klines[-1][0]) + step
+
+        # İstenen geçmiş önbellekte yoksa geriye doğru sayfalı doldurulur; geçmişi
+        # bittiği bilinen seriler (ör. yeni listelenen semboller) için istek yapılmaz
+        first, last, count = self.bounds(market, symbol, interval)
+        exhausted = self.history_exhausted(market, symbol, interval)
+        while first is not None and count < limit and not exhausted and not (cancelled and cancelled()):
+            page_limit = min(PAGE_LIMIT, limit - count)
+            klines = fetch_klines(client, market, priority, cancelled, symbol=symbol, interval=interval,
+                                  endTime=first - 1, limit=page_limit)
+            requests += 1
+            if klines is None:
+                break  # İstek iptal edildi
+            if klines:
+                self.store(market, symbol, interval, klines)
+                first, last, count = self.bounds(market, symbol, interval)
+            if len(klines) < page_limit:
+                # Sembolün daha eski verisi yok
+                self.mark_history_exhausted(market, symbol, interval)
+                exhausted = True
+
+        return self.load(market, symbol, interval, limit), requests
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,192 @@
+"""Gösterge ayarları için parametre taraması.
+
+Pencere uzunlukları ve eşikler ızgara ya da rastgele aramayla denenir; her
+deneme bir geriye dönük testtir ve süreç havuzunda çalışır. Mumlar her işe
+ayrı ayrı pickle'lanmak yerine bir kez paylaşılan belleğe yazılır, alt
+süreçler bu belleği kopyalamadan NumPy dizisi olarak okur:
+
+    python binance_optimizasyon.py --sembol BTCUSDT --periyot 1h
+    python binance_optimizasyon.py --sentetik 200000 --rastgele 200
+"""
+import argparse
+import itertools
+import multiprocessing
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from binance_geriye_test import backtest, synthetic_candles
+from binance_onbellek import KlineCache
+
+# Denenecek değerler; varsayılan ayarlar (20, 14, 30/70, 2) her ızgarada bulunur
+DEFAULT_GRID = {
+    'window': [10, 15, 20, 30, 50],
+    'rsi_window': [7, 10, 14, 21],
+    'rsi_low': [20, 25, 30, 35],
+    'rsi_high': [65, 70, 75, 80],
+    'bb_dev': [1.5, 2.0, 2.5],
+}
+
+# Sonuç tablosundaki metrikler: (anahtar, başlık)
+METRICS = [
+    ('pnl', "Getiri %"),
+    ('trades', "İşlem"),
+    ('hit_rate', "İsabet %"),
+    ('average_trade', "Ort. İşlem %"),
+    ('max_drawdown', "En Büyük Düşüş %"),
+    ('exposure', "Piyasada %"),
+]
+
+# Alt süreçlerin başlatma yöntemi; forkserver olmayan platformlarda spawn
+START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# Alt süreçteki paylaşılan bellek ve üzerindeki (kapanış, hacim) görünümü
+_shared = None
+_candles = None
+
+
+def grid_params(grid=DEFAULT_GRID):
+    """Izgaradaki tüm değer birleşimleri."""
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[key] for key in keys))]
+
+
+def random_params(grid=DEFAULT_GRID, count=100, seed=None):
+    """Izgaradan tekrarsız `count` rastgele birleşim."""
+    combinations = grid_params(grid)
+    if count >= len(combinations):
+        return combinations
+    return random.Random(seed).sample(combinations, count)
+
+
+class SharedCandles:
+    """Kapanış ve hacim dizilerini tek bir (2 × n) float64 paylaşılan bellek bloğunda tutar."""
+
+    def __init__(self, close, volume):
+        close = np.asarray(close, dtype=np.float64)
+        self.shape = (2, len(close))
+        self.memory = shared_memory.SharedMemory(create=True, size=max(1, close.nbytes * 2))
+        candles = np.ndarray(self.shape, dtype=np.float64, buffer=self.memory.buf)
+        candles[0] = close
+        candles[1] = volume
+        del candles  # Görünüm kalırsa blok kapatılamaz
+
+    def close(self):
+        self.memory.close()
+        self.memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _attach(name, shape):
+    """Alt süreç başlatıcısı: paylaşılan bloğa bağlan."""
+    global _shared, _candles
+    _shared = shared_memory.SharedMemory(name=name)
+    _candles = np.ndarray(shape, dtype=np.float64, buffer=_shared.buf)
+
+
+def _evaluate(params, fee):
+    result = backtest(_candles[0], _candles[1], fee, **params)
+    del result['equity']  # Eğrinin geri taşınmasına gerek yok
+    result.update(params)
+    return result
+
+
+def sweep(close, volume, params, fee=0.001, workers=None, progress=None, cancelled=None):
+    """Her parametre birleşimi için testi çalıştır; satırlar getiriye göre azalan sırada döner."""
+    rows = []
+    with SharedCandles(close, volume) as shared:
+        # Çağıran çok thread'li Qt süreci olabilir; fork tutulan bir kilidi alt sürece
+        # kopyalayıp kilitleyebileceğinden alt süreçler temiz başlatılır
+        context = multiprocessing.get_context(START_METHOD)
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), mp_context=context,
+                                 initializer=_attach, initargs=(shared.memory.name, shared.shape)) as pool:
+            futures = [pool.submit(_evaluate, item, fee) for item in params]
+            for done, future in enumerate(as_completed(futures), 1):
+                if cancelled and cancelled():
+                    pool.shutdown(cancel_futures=True)
+                    break
+                rows.append(future.result())
+                if progress:
+                    progress(done, len(futures))
+    rows.sort(key=lambda row: row['pnl'], reverse=True)
+    return rows
+
+
+def heatmap(rows, x_key, y_key, metric='pnl'):
+    """İki parametre için metrik matrisi; diğer parametrelerde en iyi değer alınır.
+
+    (x değerleri, y değerleri, matris[x, y]) döner; denenmemiş hücreler NaN'dır.
+    """
+    xs = sorted({row[x_key] for row in rows})
+    ys = sorted({row[y_key] for row in rows})
+    matrix = np.full((len(xs), len(ys)), np.nan)
+    x_index = {value: i for i, value in enumerate(xs)}
+    y_index = {value: i for i, value in enumerate(ys)}
+    for row in rows:
+        i, j = x_index[row[x_key]], y_index[row[y_key]]
+        if not row[metric] <= matrix[i, j]:  # NaN ile karşılaştırma False verir
+            matrix[i, j] = row[metric]
+    return xs, ys, matrix
+
+
+def format_table(rows, count=10):
+    keys = list(DEFAULT_GRID)
+    lines = ["  ".join(f"{key:>10}" for key in keys) + "  " +
+             "  ".join(f"{title:>16}" for _, title in METRICS)]
+    for row in rows[:count]:
+        values = [row[key] for key, _ in METRICS]
+        values = [value if key == 'trades' else value * 100 for (key, _), value in zip(METRICS, values)]
+        lines.append("  ".join(f"{row[key]:>10g}" for key in keys) + "  " +
+                     "  ".join(f"{value:>16.2f}" for value in values))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gösterge ayarları için parametre taraması")
+    parser.add_argument('--market', default='SPOT', choices=['SPOT', 'FUTURES'])
+    parser.add_argument('--sembol', default='BTCUSDT')
+    parser.add_argument('--periyot', default='1h')
+    parser.add_argument('--komisyon', type=float, default=0.001, help="İşlem başına komisyon oranı")
+    parser.add_argument('--rastgele', type=int, help="Izgara yerine bu kadar rastgele birleşim dene")
+    parser.add_argument('--isci', type=int, help="Süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument('--sentetik', type=int, help="Önbellek yerine bu kadar sentetik mum kullan")
+    args = parser.parse_args(argv)
+
+    if args.sentetik:
+        close, volume = synthetic_candles(args.sentetik)
+    else:
+        cache = KlineCache()
+        try:
+            close, volume = cache.load_columns(args.market, args.sembol, args.periyot, ('close', 'volume'))
+        finally:
+            cache.close()
+        if len(close) == 0:
+            print(f"Önbellekte {args.sembol} - {args.periyot} için mum yok; önce BinanceAnalyzer ile çekin.")
+            return 1
+
+    params = random_params(count=args.rastgele) if args.rastgele else grid_params()
+    start = time.perf_counter()
+    rows = sweep(close, volume, params, args.komisyon, args.isci)
+    elapsed = time.perf_counter() - start
+    print(f"{len(close)} mum, {len(rows)} birleşim, {elapsed:.2f} sn\n")
+    print(format_table(rows))
+    xs, ys, matrix = heatmap(rows, 'window', 'rsi_window')
+    print("\nEn iyi getiri % (satır: window, sütun: rsi_window)")
+    print("      " + "".join(f"{y:>9g}" for y in ys))
+    for x, line in zip(xs, matrix):
+        print(f"{x:>6g}" + "".join(f"{value * 100:>9.2f}" for value in line))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""Sembol listesi önbelleği ve arama indeksi.
+
+exchangeInfo yanıtı (birkaç MB) her market değişiminde yeniden istenmesin
+diye işlem gören semboller (sembol, taban, karşı varlık) olarak diske
+yazılır ve süresi (TTL) dolana kadar oradan okunur. SymbolIndex sembol ve
+taban varlık öneklerini sıralı listede, sembollerin üçlü harf (trigram)
+kümelerini de ters indekste tutar; böylece binlerce sembol her tuşta
+milisaniyenin altında süzülür.
+"""
+import json
+import os
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+SYMBOLS_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'binance_semboller.json')
+
+# Sembol listesi nadiren değişir; günde birkaç kez yenilemek yeterli
+SYMBOLS_TTL = 6 * 60 * 60
+
+
+def trading_symbols(exchange_info):
+    """exchangeInfo'dan işlem gören semboller: [(sembol, taban, karşı), ...]."""
+    return sorted(
+        (s['symbol'], s['baseAsset'], s['quoteAsset'])
+        for s in exchange_info['symbols'] if s['status'] == 'TRADING'
+    )
+
+
+class SymbolCache:
+    """Market başına sembol listesini zaman damgasıyla saklayan JSON dosyası."""
+
+    def __init__(self, path=SYMBOLS_CACHE, ttl=SYMBOLS_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.data = self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        if not self.path:
+            return
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f)
+        os.replace(temp_path, self.path)
+
+    def get(self, market):
+        """Süresi dolmamışsa sembol listesi, yoksa None."""
+        entry = self.data.get(market)
+        if entry is None or time.time() - entry['time'] > self.ttl:
+            return None
+        return [tuple(item) for item in entry['symbols']]
+
+    def put(self, market, symbols):
+        self.data[market] = {'time': time.time(), 'symbols': [list(item) for item in symbols]}
+        self.save()
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SymbolIndex:
+    """Sembol, taban ve karşı varlık üzerinde önek, alt dizge ve bulanık arama.
+
+    Sonuç sırası: sembol/taban varlık öneki, karşı varlık eşleşmesi, sembol
+    içinde geçen, en son da yazım hatasına dayanıklı trigram benzerliği.
+    """
+
+    def __init__(self, symbols):
+        self.symbols = sorted(symbols)
+        self.names = [symbol for symbol, _, _ in self.symbols]
+        self.prefixes = sorted(
+            (key, i) for i, (symbol, base, _) in enumerate(self.symbols) for key in {symbol, base}
+        )
+        self.quotes = defaultdict(list)
+        self.trigrams = defaultdict(set)
+        self.common = max(50, len(self.names) // 20)
+        for i, (symbol, _, quote) in enumerate(self.symbols):
+            self.quotes[quote].append(i)
+            for trigram in trigrams(symbol):
+                self.trigrams[trigram].add(i)
+
+    def __len__(self):
+        return len(self.names)
+
+    def search(self, text, limit=50):
+        """`text` ile eşleşen en fazla `limit` sembol adı."""
+        query = text.strip().upper()
+        if not query:
+            return self.names[:limit]
+        found = []
+        seen = set()
+
+        def add(ids):
+            for i in ids:
+                if i not in seen:
+                    seen.add(i)
+                    found.append(i)
+                    if len(found) >= limit:
+                        return True
+            return False
+
+        # Önekler sıralı listede ardışıktır; tam eşleşme başa gelir
+        if add(self.prefix_ids(query)):
+            return self.results(found)
+        if add(self.quotes.get(query, ())):
+            return self.results(found)
+
+        query_trigrams = trigrams(query)
+        if not query_trigrams:
+            return self.results(found)
+        # Alt dizge: tüm trigramları içeren adaylar doğrulanır
+        postings = sorted((self.trigrams.get(trigram, set()) for trigram in query_trigrams), key=len)
+        candidates = set.intersection(*postings) if postings[0] else set()
+        if add(sorted(i for i in candidates if query in self.names[i])):
+            return self.results(found)
+        # Bulanık: adaylar yalnızca seyrek trigramlardan toplanır ('USD' gibi binlerce
+        # sembolde geçenler ayırt edici değildir), puan ortak trigram sayısıdır. İlk
+        # harfler genelde doğru yazıldığından ilk üç harfle başlayanlar bir puan önde.
+        rare = [posting for posting in postings if len(posting) <= self.common]
+        head = set(self.prefix_ids(query[:3]))
+        candidates = set().union(head, *rare) - seen
+        threshold = max(1, len(query_trigrams) // 3)
+        scores = {i: sum(i in posting for posting in postings) + (i in head) for i in candidates}
+        add(sorted((i for i, score in scores.items() if score >= threshold),
+                   key=lambda i: (-scores[i], abs(len(self.names[i]) - len(query)), self.names[i])))
+        return self.results(found)
+
+    def prefix_ids(self, prefix):
+        start = bisect_left(self.prefixes, (prefix,))
+        end = bisect_left(self.prefixes, (prefix + '\uffff',), start)
+        return [i for _, i in self.prefixes[start:end]]
+
+    def results(self, ids):
+        return [self.names[i] for i in ids]
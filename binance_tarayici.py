@@ -0,0 +1,145 @@
+"""Çoklu sembol tarayıcı.
+
+Sembollerin son mumları iş parçacığı havuzunda, istek zamanlayıcısının
+ağırlık sınırına uyularak eşzamanlı çekilir; göstergeler ve sinyal
+kuralları tüm semboller için tek bir (sembol × zaman) NumPy dizisi
+üzerinde hesaplanır.
+"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+
+from binance_istek import BACKGROUND, fetch_klines
+from binance_onbellek import KLINE_DTYPE, parse_klines
+
+
+def fetch_all(client, market_type, symbols, interval, limit=100, workers=8, progress=None,
+              cancelled=None):
+    """Sembollerin son `limit` mumunu eşzamanlı çek; {sembol: mumlar} ve hatalar döner.
+
+    İstekler arka plan önceliğiyle zamanlayıcıdan geçer; kullanıcının grafik
+    istekleri tarama sürerken bekletilmez.
+    """
+    def fetch(symbol):
+        if cancelled and cancelled():
+            return None
+        return fetch_klines(client, market_type, BACKGROUND, cancelled, symbol=symbol,
+                            interval=interval, limit=limit)
+
+    results, errors = {}, {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(fetch, symbol): symbol for symbol in symbols}
+        for done, future in enumerate(as_completed(futures), 1):
+            symbol = futures[future]
+            try:
+                klines = future.result()
+                if klines:
+                    results[symbol] = klines
+            except Exception as e:
+                errors[symbol] = str(e)
+            if progress:
+                progress(done, len(futures))
+    return results, errors
+
+
+def stack_klines(results, limit):
+    """Yeterli mumu olan sembolleri (semboller, açılış, kapanış, hacim) dizilerine dönüştür."""
+    symbols = sorted(symbol for symbol, klines in results.items() if len(klines) >= limit)
+    data = np.empty((len(symbols), limit), dtype=KLINE_DTYPE)
+    for i, symbol in enumerate(symbols):
+        data[i] = parse_klines(results[symbol][-limit:])
+    return symbols, data['open'], data['close'], data['volume']
+
+
+def wilder_weights(length, window):
+    """Uzunluğu `length` olan serinin adjust=False ewm(alpha=1/window) son değer ağırlıkları."""
+    alpha = 1 / window
+    powers = (1 - alpha) ** np.arange(length - 1, -1, -1)
+    weights = alpha * powers
+    weights[0] = powers[0]  # İlk gözlem özyinelemenin başlangıç değeridir
+    return weights
+
+
+def batch_indicators(opens, closes, volumes, window=20, rsi_window=14, bb_dev=2):
+    """(sembol × zaman) dizilerinden tarayıcının kullandığı son değerleri hesapla."""
+    last = closes[:, -window:]
+    previous = closes[:, -window - 1:-1]
+    sma = last.mean(axis=1)
+    std = last.std(axis=1)
+
+    # RSI: ilk fark 0 kabul edilir (ta ile aynı); son değer ağırlıklı toplamdır
+    diff = np.diff(closes, axis=1, prepend=closes[:, :1])
+    weights = wilder_weights(closes.shape[1], rsi_window)
+    average_up = np.where(diff > 0, diff, 0.0) @ weights
+    average_down = np.where(diff < 0, -diff, 0.0) @ weights
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = np.where(average_down == 0, 100.0, 100 - 100 / (1 + average_up / average_down))
+        tail = closes[:, -5:]
+        trend = (np.diff(tail, axis=1) / tail[:, :-1]).mean(axis=1) * 100
+        change = (closes[:, -1] - opens[:, -1]) / opens[:, -1] * 100
+        volume_ratio = volumes[:, -1] / volumes[:, -window:].mean(axis=1)
+
+    return {
+        'close': closes[:, -1],
+        'close_prev': closes[:, -2],
+        'SMA20': sma,
+        'SMA20_prev': previous.mean(axis=1),
+        'BB_upper': sma + bb_dev * std,
+        'BB_lower': sma - bb_dev * std,
+        'RSI': rsi,
+        'trend': trend,
+        'change': change,
+        'volume_ratio': volume_ratio,
+    }
+
+
+# BinanceAnalyzer.update_signals ile aynı kurallar: (anahtar, açıklama)
+SIGNAL_RULES = [
+    ('rsi_low', "RSI aşırı satım"),
+    ('rsi_high', "RSI aşırı alım"),
+    ('sma_up', "SMA-20 yukarı kırılım"),
+    ('sma_down', "SMA-20 aşağı kırılım"),
+    ('bb_lower', "Bollinger alt bandı"),
+    ('bb_upper', "Bollinger üst bandı"),
+    ('volume', "Yüksek hacim"),
+    ('trend_up', "Kısa vadeli yükseliş"),
+    ('trend_down', "Kısa vadeli düşüş"),
+]
+
+
+def evaluate_signals(values):
+    """Her kural için sembol başına boolean maske."""
+    close, close_prev = values['close'], values['close_prev']
+    sma, sma_prev = values['SMA20'], values['SMA20_prev']
+    return {
+        'rsi_low': values['RSI'] < 30,
+        'rsi_high': values['RSI'] > 70,
+        'sma_up': (close > sma) & (close_prev <= sma_prev),
+        'sma_down': (close < sma) & (close_prev >= sma_prev),
+        'bb_lower': close <= values['BB_lower'],
+        'bb_upper': close >= values['BB_upper'],
+        'volume': values['volume_ratio'] > 2,
+        'trend_up': values['trend'] > 1,
+        'trend_down': values['trend'] < -1,
+    }
+
+
+def scan(symbols, opens, closes, volumes):
+    """En az bir kuralı sağlayan semboller için tablo satırları."""
+    values = batch_indicators(opens, closes, volumes)
+    masks = evaluate_signals(values)
+    hits = np.zeros(len(symbols), dtype=bool)
+    for mask in masks.values():
+        hits |= mask
+    rows = []
+    for index in np.flatnonzero(hits):
+        rows.append({
+            'symbol': symbols[index],
+            'close': float(values['close'][index]),
+            'change': float(values['change'][index]),
+            'RSI': float(values['RSI'][index]),
+            'volume_ratio': float(values['volume_ratio'][index]),
+            'trend': float(values['trend'][index]),
+            'signals': [text for key, text in SIGNAL_RULES if masks[key][index]],
+        })
+    return rows
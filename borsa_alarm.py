@@ -0,0 +1,184 @@
+import json
+import math
+from bisect import bisect_left, bisect_right, insort
+from collections import deque, namedtuple
+
+Alert = namedtuple('Alert', 'rule currency timestamp value message')
+
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+class Rule:
+    """Kullanıcı tanımlı alarm kuralı.
+
+    type: 'threshold' (level, direction='above'|'below'),
+          'move' (percent, window saniye) veya
+          'volatility' (percent, window saniye).
+    """
+
+    def __init__(self, type, currency, level=None, direction='above', percent=None,
+                 window=None, name=None):
+        if type not in ('threshold', 'move', 'volatility'):
+            raise ValueError(f"Bilinmeyen alarm tipi: {type}")
+        # Eksik alanlar kural yüklenirken reddedilir; yoksa her tick'te hata verir
+        if type == 'threshold':
+            if not is_number(level):
+                raise ValueError(f"{currency} eşik kuralında 'level' sayı olmalı")
+            if direction not in ('above', 'below'):
+                raise ValueError(f"Bilinmeyen yön: {direction}")
+        else:
+            if not is_number(percent):
+                raise ValueError(f"{currency} {type} kuralında 'percent' sayı olmalı")
+            if not is_number(window) or window <= 0:
+                raise ValueError(f"{currency} {type} kuralında 'window' pozitif sayı olmalı")
+        self.type = type
+        self.currency = currency
+        self.level = level
+        self.direction = direction
+        self.percent = percent
+        self.window = window
+        self.name = name or self.describe()
+
+    def describe(self):
+        if self.type == 'threshold':
+            sign = '≥' if self.direction == 'above' else '≤'
+            return f"{self.currency} {sign} {self.level}"
+        if self.type == 'move':
+            return f"{self.currency} {self.window}s içinde %{self.percent} hareket"
+        return f"{self.currency} {self.window}s oynaklık ≥ %{self.percent}"
+
+    @classmethod
+    def from_dict(cls, item):
+        return cls(**item)
+
+
+class ThresholdIndex:
+    """Bir dövizin eşik kuralları; seviyeye göre sıralı tutulur.
+
+    Fiyat önceki tick'ten bu tick'e geçerken aradaki seviyeler ikili arama ile
+    bulunur, böylece yalnızca kesilen eşikler değerlendirilir.
+    """
+
+    def __init__(self):
+        self.above = []  # (seviye, sıra, kural)
+        self.below = []
+        self.previous = None
+
+    def add(self, order, rule):
+        insort(self.above if rule.direction == 'above' else self.below, (rule.level, order, rule))
+
+    def update(self, value):
+        previous, self.previous = self.previous, value
+        if previous is None or value == previous:
+            return []
+        if value > previous:
+            # previous < seviye <= value
+            start = bisect_right(self.above, (previous, math.inf))
+            end = bisect_right(self.above, (value, math.inf))
+            return [rule for _, _, rule in self.above[start:end]]
+        # value <= seviye < previous
+        start = bisect_left(self.below, (value, -math.inf))
+        end = bisect_left(self.below, (previous, -math.inf))
+        return [rule for _, _, rule in self.below[start:end]]
+
+
+class WindowIndex:
+    """Aynı döviz ve pencereyi paylaşan yüzde/oynaklık kuralları.
+
+    Pencere durumu kurallar arasında paylaşılır ve tick başına O(1) güncellenir;
+    kurallar yüzdeye göre sıralı olduğundan koşulu sağlayanlar bir önek oluşturur.
+    """
+
+    def __init__(self, type, window):
+        self.type = type
+        self.window = window
+        self.rules = []  # (yüzde, sıra, kural)
+        self.points = deque()  # (zaman, değer) veya (zaman, getiri)
+        self.previous = None
+        self.sum = 0.0
+        self.sum_sq = 0.0
+        self.active = 0  # Şu anda koşulu sağlayan kural sayısı
+
+    def add(self, order, rule):
+        insort(self.rules, (rule.percent, order, rule))
+
+    def measure(self, timestamp, value):
+        if self.type == 'move':
+            self.points.append((timestamp, value))
+            # Pencerenin başındaki (ya da hemen öncesindeki) nokta referans alınır
+            while len(self.points) > 1 and self.points[1][0] <= timestamp - self.window:
+                self.points.popleft()
+            reference = self.points[0][1]
+            return abs(value - reference) / reference * 100 if reference else 0.0
+
+        previous, self.previous = self.previous, value
+        if previous is None or previous <= 0 or value <= 0:
+            return 0.0
+        change = math.log(value / previous)
+        self.points.append((timestamp, change))
+        self.sum += change
+        self.sum_sq += change * change
+        while self.points[0][0] <= timestamp - self.window:
+            _, old = self.points.popleft()
+            self.sum -= old
+            self.sum_sq -= old * old
+        count = len(self.points)
+        if count < 2:
+            return 0.0
+        variance = max(0.0, (self.sum_sq - self.sum * self.sum / count) / (count - 1))
+        return math.sqrt(variance) * 100
+
+    def update(self, timestamp, value):
+        measured = self.measure(timestamp, value)
+        active = bisect_right(self.rules, (measured, math.inf))
+        # Yalnızca koşulu yeni sağlamaya başlayan kurallar tetiklenir
+        fired = [rule for _, _, rule in self.rules[self.active:active]]
+        self.active = active
+        return fired, measured
+
+
+class AlertEngine:
+    """Kuralları dövize göre indeksleyip her tick'te artımlı değerlendirir."""
+
+    def __init__(self, rules=()):
+        self.thresholds = {}
+        self.windows = {}  # döviz -> {(tip, pencere): WindowIndex}
+        self.count = 0
+        for rule in rules:
+            self.add_rule(rule)
+
+    def __len__(self):
+        return self.count
+
+    def add_rule(self, rule):
+        order = self.count
+        self.count += 1
+        if rule.type == 'threshold':
+            self.thresholds.setdefault(rule.currency, ThresholdIndex()).add(order, rule)
+        else:
+            groups = self.windows.setdefault(rule.currency, {})
+            key = (rule.type, rule.window)
+            if key not in groups:
+                groups[key] = WindowIndex(rule.type, rule.window)
+            groups[key].add(order, rule)
+
+    def evaluate(self, currency, timestamp, value):
+        alerts = []
+        index = self.thresholds.get(currency)
+        if index is not None:
+            for rule in index.update(value):
+                alerts.append(Alert(rule, currency, timestamp, value,
+                                    f"{rule.name} (değer: {value:.4f})"))
+        for group in self.windows.get(currency, {}).values():
+            fired, measured = group.update(timestamp, value)
+            for rule in fired:
+                alerts.append(Alert(rule, currency, timestamp, value,
+                                    f"{rule.name} (ölçülen: %{measured:.3f})"))
+        return alerts
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls(Rule.from_dict(item) for item in json.load(f))
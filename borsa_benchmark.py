@@ -0,0 +1,89 @@
+"""BorsaTakip yük ölçümü.
+
+Yerel taklit sunucuya karşı, ekransız (offscreen) Qt ile tick başına veri
+çekme gecikmesini, istatistik hesaplama süresini ve çizim süresini ölçer:
+
+    python borsa_benchmark.py --dovizler 10,100,1000 --tick 50
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+# Qt içe aktarılmadan önce ayarlanmalı
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from BorsaTakip import BorsaTakip
+from borsa_istemci import RateClient
+from borsa_mock_sunucu import currency_codes, start_server
+
+
+def summarize(samples):
+    samples = np.asarray(samples) * 1000
+    return np.median(samples), np.percentile(samples, 95)
+
+
+def run(app, count, ticks, latency):
+    server, url = start_server(count, latency=latency, update_interval=0, seed=count)
+    client = RateClient(url, cache_path=None)
+    fetch_times, stats_times, render_times = [], [], []
+    try:
+        with tempfile.TemporaryDirectory() as history_dir:
+            window = BorsaTakip(currency_codes(count), url, history_dir, cache_path=None)
+            window.timer.stop()
+            window.resize(1200, 800)
+            window.show()
+            # Pencerenin açılışta başlattığı isteğin bitmesi beklenir
+            deadline = time.perf_counter() + 5
+            while window.fetch_in_flight and time.perf_counter() < deadline:
+                app.processEvents()
+            app.processEvents()
+
+            for _ in range(ticks):
+                start = time.perf_counter()
+                data = client.fetch()
+                fetched = time.perf_counter()
+                window.collector.ingest(data, datetime.now())
+                computed = time.perf_counter()
+                window.render_frame()
+                app.processEvents()
+                rendered = time.perf_counter()
+
+                fetch_times.append(fetched - start)
+                stats_times.append(computed - fetched)
+                render_times.append(rendered - computed)
+            window.close()
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+    return summarize(fetch_times), summarize(stats_times), summarize(render_times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="BorsaTakip yük ölçümü")
+    parser.add_argument('--dovizler', default='10,100,1000',
+                        help="Denenecek döviz sayıları, virgülle ayrılmış")
+    parser.add_argument('--tick', type=int, default=50, help="Her senaryoda ölçülecek tick sayısı")
+    parser.add_argument('--gecikme', type=float, default=0.0,
+                        help="Taklit sunucunun yanıt gecikmesi (saniye)")
+    args = parser.parse_args(argv)
+
+    app = QApplication(sys.argv[:1])
+    print(f"{'Döviz':>6} | {'Çekme ms (med/p95)':>20} | {'İstatistik ms':>16} | {'Çizim ms':>16}")
+    print('-' * 68)
+    for count in [int(c) for c in args.dovizler.split(',') if c.strip()]:
+        fetch, stats, render = run(app, count, args.tick, args.gecikme)
+        print(f"{count:>6} | {fetch[0]:>9.2f} / {fetch[1]:>8.2f} | "
+              f"{stats[0]:>6.2f} / {stats[1]:>7.2f} | {render[0]:>6.2f} / {render[1]:>7.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,137 @@
+import os
+import queue
+import threading
+import time
+import zipfile
+
+import numpy as np
+
+HISTORY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'kur_gecmisi')
+
+
+class TickStore:
+    """Döviz başına sütunlu, yalnızca sona eklenen tick deposu.
+
+    Her döviz için `<DÖVİZ>.time` ve `<DÖVİZ>.value` adlı iki float64 dosyası
+    tutulur. Yazma işlemleri arka plandaki bir thread'de toplu yapılır,
+    okuma ise mmap ile dosyayı belleğe kopyalamadan gerçekleşir. Kapanışta
+    mumlar da `<DÖVİZ>.candles.npz` olarak saklanır; açılışta tüm geçmiş
+    yeniden taranmaz.
+    """
+
+    def __init__(self, directory=HISTORY_DIR, flush_interval=1.0):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        os.makedirs(self.directory, exist_ok=True)
+        self._files = {}
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._writer = threading.Thread(target=self._run, name='TickStoreWriter', daemon=True)
+        self._writer.start()
+
+    def column_path(self, currency, column):
+        return os.path.join(self.directory, f'{currency}.{column}')
+
+    def append(self, timestamp, currencies, values):
+        # Bloklamaz; veriler yazıcı thread'e kuyrukla aktarılır
+        self._queue.put((float(timestamp), list(currencies), np.asarray(values, dtype=np.float64)))
+
+    def load(self, currency):
+        """Dövizin tüm tick'lerini (zamanlar, değerler) mmap görünümü olarak döndür."""
+        times = self._map(self.column_path(currency, 'time'))
+        values = self._map(self.column_path(currency, 'value'))
+        # Yarım kalmış bir yazmadan sonra sütun uzunlukları farklı olabilir
+        size = min(len(times), len(values))
+        return times[:size], values[:size]
+
+    def save_candles(self, currency, state):
+        """Dövizin mum durumunu `<DÖVİZ>.candles.npz` dosyasına yaz."""
+        path = self.column_path(currency, 'candles.npz')
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            np.savez(f, **state)
+        os.replace(temp_path, path)
+
+    def load_candles(self, currency):
+        """Kaydedilmiş mum durumu; yoksa ya da okunamıyorsa None."""
+        path = self.column_path(currency, 'candles.npz')
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                return {key: data[key] for key in data.files}
+        except (OSError, ValueError, zipfile.BadZipFile):
+            return None
+
+    def _map(self, path):
+        if not os.path.exists(path) or os.path.getsize(path) < 8:
+            return np.empty(0, dtype=np.float64)
+        count = os.path.getsize(path) // 8
+        return np.memmap(path, dtype=np.float64, mode='r', shape=(count,))
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            if batch[0] is None:
+                return
+            # İlk tick'ten sonraki bir aralık boyunca gelenler tek seferde yazılır;
+            # tick'ler aralıksız gelse de hiçbiri bir aralıktan uzun bekletilmez
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            try:
+                while True:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    if item is None:
+                        stop = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= 1000:
+                        break
+            except queue.Empty:
+                pass
+            self._write(batch)
+            if stop:
+                return
+
+    def _write(self, batch):
+        columns = {}
+        for timestamp, currencies, values in batch:
+            for currency, value in zip(currencies, values.tolist()):
+                if value == value:  # NaN değerler saklanmaz
+                    times, vals = columns.setdefault(currency, ([], []))
+                    times.append(timestamp)
+                    vals.append(value)
+
+        with self._lock:
+            for currency, (times, vals) in columns.items():
+                time_file, value_file = self._open(currency)
+                time_file.write(np.asarray(times, dtype=np.float64).tobytes())
+                value_file.write(np.asarray(vals, dtype=np.float64).tobytes())
+                time_file.flush()
+                value_file.flush()
+
+    def _open(self, currency):
+        files = self._files.get(currency)
+        if files is None:
+            # Yarım kalmış bir yazma varsa sütunlar ortak uzunluğa kırpılır
+            paths = [self.column_path(currency, 'time'), self.column_path(currency, 'value')]
+            sizes = [os.path.getsize(p) if os.path.exists(p) else 0 for p in paths]
+            size = min(sizes) // 8 * 8
+            for path, current in zip(paths, sizes):
+                if current != size:
+                    os.truncate(path, size)
+            files = (open(self.column_path(currency, 'time'), 'ab'),
+                     open(self.column_path(currency, 'value'), 'ab'))
+            self._files[currency] = files
+        return files
+
+    def close(self):
+        # Kuyrukta kalan tüm tick'ler yazıldıktan sonra dosyalar kapatılır
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        with self._lock:
+            for time_file, value_file in self._files.values():
+                time_file.close()
+                value_file.close()
+            self._files.clear()
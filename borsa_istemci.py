@@ -0,0 +1,172 @@
+import json
+import os
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Update the API URL with your actual API key
+API_URL = 'https://v6.exchangerate-api.com/v6/dac92d78d8c1d4a2893eff4d/latest/USD'
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'kur_onbellek.json')
+
+
+class RateClient:
+    """Kur API'si için kalıcı (keep-alive) oturum ve önbellek kullanan istemci.
+
+    Sağlayıcının bildirdiği bir sonraki güncelleme zamanına kadar yanıt
+    diskteki önbellekten verilir; sonrasında ETag/Last-Modified ile koşullu
+    istek yapılır.
+    """
+
+    def __init__(self, url=API_URL, timeout=5, cache_path=CACHE_PATH):
+        self.url = url
+        self.timeout = timeout
+        self.cache_path = cache_path
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.cache = self.load_cache()
+        # hits: ağa çıkmadan, revalidated: 304 ile, misses: tam indirme ile
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0}
+        # Son yanıtın kurları bir öncekinden farklı mıydı ve hangi başlıklarla geldi
+        self.changed = False
+        self.last_headers = {}
+
+    def load_cache(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('url') != self.url:
+                return None
+            return cache
+        except (OSError, ValueError):
+            return None
+
+    def save_cache(self):
+        if not self.cache_path:
+            return
+        temp_path = self.cache_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.cache, f)
+        os.replace(temp_path, self.cache_path)
+
+    def is_fresh(self):
+        if self.cache is None:
+            return False
+        next_update = self.cache['data'].get('time_next_update_unix')
+        return next_update is not None and time.time() < next_update
+
+    def fetch(self):
+        self.changed = False
+        self.last_headers = {}
+        if self.is_fresh():
+            self.stats['hits'] += 1
+            return self.cache['data']
+
+        headers = {}
+        if self.cache is not None:
+            if self.cache.get('etag'):
+                headers['If-None-Match'] = self.cache['etag']
+            if self.cache.get('last_modified'):
+                headers['If-Modified-Since'] = self.cache['last_modified']
+
+        response = self.session.get(self.url, headers=headers, timeout=self.timeout)
+        self.last_headers = dict(response.headers)
+        if response.status_code == 304 and self.cache is not None:
+            self.stats['revalidated'] += 1
+            return self.cache['data']
+        response.raise_for_status()  # Raises an error for bad responses
+
+        data = response.json()
+        self.stats['misses'] += 1
+        previous = self.cache['data'].get('conversion_rates') if self.cache is not None else None
+        self.changed = data.get('conversion_rates') != previous
+        self.cache = {
+            'url': self.url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'data': data,
+        }
+        try:
+            self.save_cache()
+        except OSError:
+            pass  # Disk önbelleği yazılamazsa bellek içi önbellekle devam edilir
+        return data
+
+    def close(self):
+        self.session.close()
+
+
+def retry_after(headers):
+    """Hız sınırı başlıklarından beklenmesi gereken süreyi (saniye) çıkar."""
+    if not headers:
+        return None
+    value = headers.get('Retry-After')
+    if value is not None:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    # Kota tükendiyse sıfırlanma zamanına kadar beklenir
+    if headers.get('X-RateLimit-Remaining') == '0' and headers.get('X-RateLimit-Reset'):
+        try:
+            reset = float(headers['X-RateLimit-Reset'])
+        except ValueError:
+            return None
+        # Hem "kalan saniye" hem de Unix zamanı biçimi kullanılabiliyor
+        return max(0.0, reset - time.time()) if reset > 1e9 else reset
+    return None
+
+
+class PollScheduler:
+    """Sorgu aralığını yanıtlara göre ayarlayan zamanlayıcı.
+
+    Kurlar değişmedikçe aralık `idle_factor` ile uzar, değişince temel aralığa
+    döner. Hatalarda üstel geri çekilme ve rastgele sapma (jitter) uygulanır;
+    hız sınırı başlıkları varsa onlara uyulur.
+    """
+
+    def __init__(self, base_interval=1.0, max_interval=60.0, idle_factor=1.5,
+                 max_backoff=300.0):
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.idle_factor = idle_factor
+        self.max_backoff = max_backoff
+        self.interval = base_interval
+        self.failures = 0  # Ardışık hata sayısı
+        self.total_errors = 0
+        self.last_error = None
+
+    def success(self, changed, headers=None):
+        self.failures = 0
+        if changed:
+            self.interval = self.base_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.idle_factor)
+        wait = retry_after(headers)
+        if wait is not None:
+            self.interval = max(self.interval, wait)
+        return self.interval
+
+    def failure(self, error=None, headers=None):
+        self.failures += 1
+        self.total_errors += 1
+        self.last_error = str(error) if error is not None else None
+        if headers is None:
+            response = getattr(error, 'response', None)
+            headers = response.headers if response is not None else None
+        backoff = min(self.max_backoff, self.base_interval * 2 ** self.failures)
+        # Aynı anda başarısız olan istemcilerin senkronize olmaması için
+        self.interval = random.uniform(backoff / 2, backoff)
+        wait = retry_after(headers)
+        if wait is not None:
+            self.interval = max(self.interval, wait)
+        return self.interval
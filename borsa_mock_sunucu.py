@@ -0,0 +1,125 @@
+"""Kur API'sinin yerel taklidi.
+
+exchangerate-api yanıt biçiminde sentetik `conversion_rates` üretir; canlı
+API'ye gitmeden BorsaTakip ve toplayıcıyı denemek/ölçmek için kullanılır:
+
+    python borsa_mock_sunucu.py --port 8765 --dovizler 100 --guncelleme 0
+    python BorsaTakip.py --url http://127.0.0.1:8765/latest/USD
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import random
+import string
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def currency_codes(count):
+    """İzlenebilecek `count` döviz kodu; kalanlar sentetik üç harfli kodlardır."""
+    codes = ['USD', 'EUR', 'GBP'][:count]
+    for letters in itertools.product(string.ascii_uppercase, repeat=3):
+        if len(codes) >= count:
+            break
+        code = ''.join(letters)
+        if code not in codes and code != 'TRY':
+            codes.append(code)
+    return codes
+
+
+class RateFeed:
+    """Her güncellemede rastgele yürüyüşle değişen sentetik kurlar."""
+
+    def __init__(self, count, update_interval=1.0, seed=None):
+        self.random = random.Random(seed)
+        self.update_interval = update_interval
+        self.rates = {code: self.random.uniform(0.5, 50.0) for code in currency_codes(count)}
+        self.rates['USD'] = 1.0
+        self.rates['TRY'] = 32.0
+        self.lock = threading.Lock()
+        self.updated_at = 0.0
+        self.next_update = 0.0
+        self.body = b''
+        self.etag = ''
+
+    def payload(self):
+        with self.lock:
+            now = time.time()
+            # update_interval 0 ise her istekte yeni kurlar üretilir
+            if now >= self.next_update:
+                for code in self.rates:
+                    if code != 'USD':
+                        self.rates[code] *= 1 + self.random.gauss(0, 0.001)
+                self.updated_at = now
+                self.next_update = now + self.update_interval
+                self.body = json.dumps({
+                    'result': 'success',
+                    'base_code': 'USD',
+                    'time_last_update_unix': int(self.updated_at),
+                    'time_next_update_unix': int(self.next_update) if self.update_interval else 0,
+                    'conversion_rates': self.rates,
+                }).encode()
+                self.etag = '"' + hashlib.md5(self.body).hexdigest() + '"'
+            return self.body, self.etag, self.updated_at
+
+
+def make_handler(feed, latency):
+    class RateHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # keep-alive
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            if latency:
+                time.sleep(latency)
+            body, etag, updated_at = feed.payload()
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', formatdate(updated_at, usegmt=True))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return RateHandler
+
+
+def start_server(count=100, port=0, latency=0.0, update_interval=1.0, seed=None):
+    """Sunucuyu arka planda başlat; (sunucu, URL) döndürür. port=0 boş port seçer."""
+    feed = RateFeed(count, update_interval, seed)
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(feed, latency))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='MockRateServer', daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}/latest/USD'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yerel sentetik kur sunucusu")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--dovizler', type=int, default=100, help="Üretilecek döviz sayısı")
+    parser.add_argument('--gecikme', type=float, default=0.0, help="Yanıt gecikmesi (saniye)")
+    parser.add_argument('--guncelleme', type=float, default=1.0,
+                        help="Kurların yenilenme aralığı (saniye, 0: her istekte)")
+    args = parser.parse_args(argv)
+
+    server, url = start_server(args.dovizler, args.port, args.gecikme, args.guncelleme)
+    print(f"Sunucu çalışıyor: {url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+"""Ekransız kur toplayıcı.
+
+BorsaTakip ile aynı veri/istatistik mantığını PyQt veya pyqtgraph yüklemeden
+çalıştırır; sunucularda tick deposunu doldurmak için kullanılır:
+
+    python borsa_toplayici.py --dovizler USD,EUR,GBP --aralik 1
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from datetime import datetime
+
+from borsa_veri import CurrencySeries, DEFAULT_CURRENCIES, cross_rates
+from borsa_istemci import RateClient, PollScheduler, API_URL
+from borsa_depo import TickStore, HISTORY_DIR
+from borsa_alarm import AlertEngine
+
+# Döviz başına tutulacak en fazla tick sayısı
+HISTORY_SIZE = 100000
+
+TREND_ARROWS = {1: '⬆', -1: '⬇', 0: '➡'}
+
+# ETag önbelleği; arayüzle aynı anda farklı adreslerle çalışınca birbirinin
+# önbelleğini ezmemesi için arayüzünkünden (kur_onbellek.json) ayrı tutulur
+COLLECTOR_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'kur_onbellek_toplayici.json')
+
+
+class RateCollector:
+    """Kurları işleyip döviz serilerini ve tick deposunu güncelleyen çekirdek."""
+
+    def __init__(self, currencies=None, client=None, store=None, history_size=HISTORY_SIZE,
+                 alert_engine=None):
+        self.currencies = list(currencies or DEFAULT_CURRENCIES)
+        self.client = client
+        self.store = store
+        self.alert_engine = alert_engine
+        self.alerts = deque(maxlen=1000)  # Henüz gösterilmemiş alarmlar
+        self.currency_data = {currency: CurrencySeries(history_size) for currency in self.currencies}
+
+        # Önceki oturumlardan kalan geçmiş mmap ile okunur; mumlar kaydedilen
+        # durumdan ve sonrasındaki tick'lerden, ham pencere son `history_size`
+        # tick'ten oluşturulur
+        if self.store is not None:
+            for currency, series in self.currency_data.items():
+                series.extend(*self.store.load(currency), self.store.load_candles(currency))
+
+    def poll(self):
+        if self.client is None:
+            self.client = RateClient(cache_path=COLLECTOR_CACHE_PATH)
+        data = self.client.fetch()
+        return self.ingest(data, datetime.now())
+
+    def ingest(self, data, current_time):
+        # Tüm dövizlerin TRY karşılığı tek bir vektör işlemiyle hesaplanır
+        timestamp = current_time.timestamp()
+        values = cross_rates(data['conversion_rates'], self.currencies)
+        if self.store is not None:
+            self.store.append(timestamp, self.currencies, values)
+        for currency, current_value in zip(self.currencies, values.tolist()):
+            if current_value == current_value:  # NaN: yanıtta olmayan döviz
+                self.currency_data[currency].append(timestamp, current_value)
+                if self.alert_engine is not None:
+                    self.alerts.extend(self.alert_engine.evaluate(currency, timestamp, current_value))
+        return values
+
+    def drain_alerts(self):
+        alerts = list(self.alerts)
+        self.alerts.clear()
+        return alerts
+
+    def summary_lines(self):
+        lines = []
+        for currency, series in self.currency_data.items():
+            if len(series):
+                first, latest = series.first(), series.latest()
+                change_percent = ((latest - first) / first * 100) if first != 0 else 0
+                lines.append(
+                    f"{currency}: {latest:.4f} TRY {TREND_ARROWS[series.trend]} "
+                    f"En Yüksek: {series.high:.4f} En Düşük: {series.low:.4f} "
+                    f"Ortalama: {series.average:.4f} EWMA: {series.stats.ewma:.4f} "
+                    f"Std. Sapma: {series.stats.std:.4f} "
+                    f"Oynaklık: %{series.stats.realized_volatility:.3f} "
+                    f"Z: {series.stats.zscore(latest):.2f} ({change_percent:.2f}%)"
+                )
+        return lines
+
+    def close(self):
+        if self.client is not None:
+            self.client.close()
+        if self.store is not None:
+            for currency, series in self.currency_data.items():
+                state = series.candle_state()
+                if state is not None:
+                    self.store.save_candles(currency, state)
+            self.store.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ekransız kur toplayıcı")
+    parser.add_argument('--dovizler', default=','.join(DEFAULT_CURRENCIES),
+                        help="İzlenecek dövizler, virgülle ayrılmış (örn. USD,EUR,JPY)")
+    parser.add_argument('--aralik', type=float, default=1.0, help="Temel sorgu aralığı (saniye)")
+    parser.add_argument('--en-uzun-aralik', type=float, default=60.0,
+                        help="Kurlar değişmedikçe uzayan aralığın üst sınırı (saniye)")
+    parser.add_argument('--adet', type=int, default=0, help="Toplam sorgu sayısı (0: sınırsız)")
+    parser.add_argument('--pencere', type=int, default=HISTORY_SIZE,
+                        help="İstatistikler için döviz başına tutulacak tick sayısı")
+    parser.add_argument('--gecmis-dizini', default=HISTORY_DIR, help="Tick deposunun dizini")
+    parser.add_argument('--url', default=API_URL, help="Kur API adresi (örn. yerel taklit sunucu)")
+    parser.add_argument('--onbellek', default=COLLECTOR_CACHE_PATH, help="ETag önbellek dosyası")
+    parser.add_argument('--alarmlar', help="Alarm kurallarını içeren JSON dosyası")
+    parser.add_argument('--sessiz', action='store_true', help="Özet satırlarını yazdırma")
+    args = parser.parse_args(argv)
+
+    currencies = [c.strip().upper() for c in args.dovizler.split(',') if c.strip()]
+    alert_engine = AlertEngine.load(args.alarmlar) if args.alarmlar else None
+    collector = RateCollector(currencies, client=RateClient(args.url, cache_path=args.onbellek),
+                              store=TickStore(args.gecmis_dizini), history_size=args.pencere,
+                              alert_engine=alert_engine)
+    scheduler = PollScheduler(args.aralik, args.en_uzun_aralik)
+    polls = 0
+    try:
+        while not args.adet or polls < args.adet:
+            started = time.monotonic()
+            try:
+                collector.poll()
+                delay = scheduler.success(collector.client.changed, collector.client.last_headers)
+                if not args.sessiz:
+                    print(datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+                    print("\n".join(collector.summary_lines()), flush=True)
+                for alert in collector.drain_alerts():
+                    print(f"🔔 {alert.message}", flush=True)
+            except Exception as e:
+                delay = scheduler.failure(e)
+                print(f"Veri güncelleme hatası: {e} (sonraki deneme {delay:.1f} sn sonra)",
+                      file=sys.stderr)
+            polls += 1
+            if args.adet and polls >= args.adet:
+                break
+            # Aralık, sorgunun başlangıcından itibaren sayılır
+            time.sleep(max(0.0, delay - (time.monotonic() - started)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        collector.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
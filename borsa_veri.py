@@ -0,0 +1,410 @@
+import math
+from collections import deque
+
+import numpy as np
+
+DEFAULT_CURRENCIES = ['USD', 'EUR', 'GBP']
+
+# EWMA için tick cinsinden yayılım (alpha = 2 / (span + 1))
+EWMA_SPAN = 20
+
+# (ad, saniye, döviz başına tutulacak mum sayısı)
+RESOLUTIONS = (
+    ('1m', 60, 10080),     # 1 hafta
+    ('5m', 300, 8640),     # 30 gün
+    ('1h', 3600, 8760),    # 1 yıl
+    ('1d', 86400, 3650),   # 10 yıl
+)
+
+
+def cross_rates(conversion_rates, currencies, target='TRY'):
+    """Her dövizin 1 biriminin hedef para birimi karşılığını tek seferde hesapla.
+
+    `conversion_rates` USD tabanlı olduğundan çapraz kur hedef/döviz
+    oranıdır. Yanıtta olmayan dövizler için NaN döner.
+    """
+    rates = np.fromiter((conversion_rates.get(c, np.nan) for c in currencies),
+                        dtype=np.float64, count=len(currencies))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return float(conversion_rates[target]) / rates
+
+
+class RingBuffer:
+    """Sabit kapasiteli, NumPy tabanlı halka tampon."""
+
+    def __init__(self, capacity, dtype=np.float64):
+        if capacity < 1:
+            raise ValueError("Kapasite en az 1 olmalı")
+        self.capacity = int(capacity)
+        self._data = np.zeros(self.capacity, dtype=dtype)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, value):
+        # Doluysa en eski elemanın üzerine yazılır ve o eleman döndürülür
+        end = (self._start + self._size) % self.capacity
+        evicted = None
+        if self._size == self.capacity:
+            evicted = self._data[end].item()
+            self._start = (self._start + 1) % self.capacity
+        else:
+            self._size += 1
+        self._data[end] = value
+        return evicted
+
+    def extend(self, values):
+        # Toplu ekleme; yalnızca sığan son `capacity` eleman tutulur
+        values = np.asarray(values)[-self.capacity:]
+        for chunk in (values[:self.capacity - len(self)], values[self.capacity - len(self):]):
+            if not len(chunk):
+                continue
+            end = (self._start + self._size) % self.capacity
+            first = min(len(chunk), self.capacity - end)
+            self._data[end:end + first] = chunk[:first]
+            self._data[:len(chunk) - first] = chunk[first:]
+            overflow = max(0, self._size + len(chunk) - self.capacity)
+            self._size = min(self.capacity, self._size + len(chunk))
+            self._start = (self._start + overflow) % self.capacity
+
+    def set_last(self, value):
+        self._data[(self._start + self._size - 1) % self.capacity] = value
+
+    def first(self):
+        return self._data[self._start].item()
+
+    def last(self):
+        return self._data[(self._start + self._size - 1) % self.capacity].item()
+
+    def to_array(self):
+        # Eskiden yeniye sıralı kopya
+        end = self._start + self._size
+        if end <= self.capacity:
+            return self._data[self._start:end].copy()
+        return np.concatenate((self._data[self._start:], self._data[:end - self.capacity]))
+
+    def clear(self):
+        self._start = 0
+        self._size = 0
+
+
+def pick_resolution(span, min_points, resolutions=RESOLUTIONS):
+    """Görünen aralığı en az `min_points` mumla dolduran en kaba çözünürlüğü seç.
+
+    Hiçbiri yetmiyorsa (aralık çok kısa) None döner; ham tick'ler çizilir.
+    """
+    for name, seconds, _ in reversed(resolutions):
+        if span / seconds >= min_points:
+            return name
+    return None
+
+
+def decimate_minmax(x, y, x_min, x_max, columns):
+    """Her piksel sütunu için en düşük ve en yüksek noktayı koruyarak seyrelt.
+
+    `x` sıralı olmalıdır. Sütun başına iki nokta döner, böylece kısa süreli
+    sıçramalar seyreltme sırasında kaybolmaz.
+    """
+    if len(x) <= 2 * columns:
+        return x, y
+    edges = np.linspace(x_min, x_max, columns + 1)[1:-1]
+    starts = np.unique(np.r_[0, np.searchsorted(x, edges)])
+    starts = starts[starts < len(x)]
+    lows = np.minimum.reduceat(y, starts)
+    highs = np.maximum.reduceat(y, starts)
+    return np.repeat(x[starts], 2), np.column_stack((lows, highs)).ravel()
+
+
+OHLC_FIELDS = ('starts', 'opens', 'highs', 'lows', 'closes')
+
+
+class OHLCAggregator:
+    """Tick'leri sabit süreli açılış/yüksek/düşük/kapanış mumlarında toplar."""
+
+    def __init__(self, resolution, capacity):
+        self.resolution = resolution
+        self.starts = RingBuffer(capacity)
+        self.opens = RingBuffer(capacity)
+        self.highs = RingBuffer(capacity)
+        self.lows = RingBuffer(capacity)
+        self.closes = RingBuffer(capacity)
+        self._high = self._low = 0.0
+
+    def __len__(self):
+        return len(self.starts)
+
+    def add(self, timestamp, value):
+        start = timestamp - timestamp % self.resolution
+        if len(self.starts) and start <= self.starts.last():
+            # Açık mum yerinde güncellenir
+            if value > self._high:
+                self._high = value
+                self.highs.set_last(value)
+            if value < self._low:
+                self._low = value
+                self.lows.set_last(value)
+            self.closes.set_last(value)
+            return
+        self._high = self._low = value
+        for buffer, item in ((self.starts, start), (self.opens, value), (self.highs, value),
+                             (self.lows, value), (self.closes, value)):
+            buffer.append(item)
+
+    def window_start(self, timestamp):
+        """`timestamp` anında tutulabilecek en eski mumun başlangıcı."""
+        return timestamp - timestamp % self.resolution - (self.starts.capacity - 1) * self.resolution
+
+    def extend(self, timestamps, values):
+        if len(self) and len(values):
+            # Açık mumun aralığına düşen tick'ler o mumla birleştirilir
+            split = int(np.searchsorted(timestamps, self.starts.last() + self.resolution))
+            if split:
+                head = values[:split]
+                self._high = max(self._high, float(head.max()))
+                self._low = min(self._low, float(head.min()))
+                self.highs.set_last(self._high)
+                self.lows.set_last(self._low)
+                self.closes.set_last(float(head[-1]))
+                timestamps, values = timestamps[split:], values[split:]
+        if not len(values):
+            return
+
+        # Yeni mumlar toplu yüklenir: mum sınırları bulunup reduceat ile indirgenir
+        buckets = timestamps - timestamps % self.resolution
+        first = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        last = np.r_[first[1:] - 1, len(values) - 1]
+        self.starts.extend(buckets[first])
+        self.opens.extend(values[first])
+        self.highs.extend(np.maximum.reduceat(values, first))
+        self.lows.extend(np.minimum.reduceat(values, first))
+        self.closes.extend(values[last])
+        self._high = self.highs.last()
+        self._low = self.lows.last()
+
+    def state(self):
+        return {field: getattr(self, field).to_array() for field in OHLC_FIELDS}
+
+    def restore(self, state):
+        """Kaydedilmiş mumları boş toplayıcıya yükle."""
+        for field in OHLC_FIELDS:
+            getattr(self, field).extend(state[field])
+        if len(self):
+            self._high = self.highs.last()
+            self._low = self.lows.last()
+
+
+class RollingStats:
+    """Kayan pencere için O(1) güncellenen istatistikler.
+
+    Ortalama ve varyans Welford yöntemiyle, gerçekleşmiş oynaklık ise pencere
+    içindeki logaritmik getirilerin kareler toplamıyla tutulur. EWMA pencereden
+    bağımsız, tüm geçmiş üzerinden hesaplanır.
+    """
+
+    def __init__(self, span=EWMA_SPAN):
+        self.span = span
+        self.alpha = 2 / (span + 1)
+        self.count = 0
+        self.mean = 0.0
+        self.ewma = None
+        self._m2 = 0.0
+        self._squared_returns = 0.0
+
+    def add(self, value, previous=None):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.ewma = value if self.ewma is None else self.ewma + self.alpha * (value - self.ewma)
+        if previous:
+            self._squared_returns += math.log(value / previous) ** 2
+
+    def remove(self, value, next_value=None):
+        # Pencereden çıkan en eski değer ve onunla yeni en eski değer arasındaki getiri düşülür
+        self.count -= 1
+        if self.count == 0:
+            self.mean = self._m2 = self._squared_returns = 0.0
+            return
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self._m2 -= delta * (value - self.mean)
+        if next_value and value:
+            self._squared_returns -= math.log(next_value / value) ** 2
+
+    def reset(self, values):
+        """Pencere durumunu verilen değerlerden vektörel olarak yeniden kur."""
+        self.count = len(values)
+        self.mean = float(values.mean()) if self.count else 0.0
+        self._m2 = float(((values - self.mean) ** 2).sum()) if self.count else 0.0
+        self._squared_returns = float((np.diff(np.log(values)) ** 2).sum()) if self.count > 1 else 0.0
+
+    def reset_ewma(self, values):
+        # Ağırlığı ihmal edilebilir eski değerler atlanır; kalan kısım kapalı formla hesaplanır
+        tail = values[-40 * self.span:]
+        weights = self.alpha * (1 - self.alpha) ** np.arange(len(tail) - 1, -1, -1)
+        weights[0] = (1 - self.alpha) ** (len(tail) - 1)
+        self.ewma = float(np.dot(weights, tail))
+
+    @property
+    def std(self):
+        return math.sqrt(max(0.0, self._m2) / (self.count - 1)) if self.count > 1 else 0.0
+
+    @property
+    def realized_volatility(self):
+        """Pencere boyunca gerçekleşmiş oynaklık (yüzde)."""
+        return math.sqrt(max(0.0, self._squared_returns)) * 100
+
+    def zscore(self, value):
+        std = self.std
+        return (value - self.mean) / std if std else 0.0
+
+
+class CurrencySeries:
+    """Bir döviz için zaman/değer penceresi ve O(1) güncellenen istatistikler."""
+
+    def __init__(self, capacity, resolutions=RESOLUTIONS):
+        self.times = RingBuffer(capacity)
+        self.values = RingBuffer(capacity)
+        self.candles = {name: OHLCAggregator(seconds, size) for name, seconds, size in resolutions}
+        self.last_value = 0
+        self.trend = 0  # 1: yükseliş, -1: düşüş, 0: değişim yok
+        # Grafiğin otomatik aralığı için tüm geçmişin sınırları
+        self.first_time = None
+        self.all_time_high = -np.inf
+        self.all_time_low = np.inf
+        self.stats = RollingStats()
+        self._count = 0  # Şimdiye kadar eklenen toplam tick sayısı
+        self._evictions = 0
+        # Monoton kuyruklar: (tick indeksi, değer)
+        self._max_queue = deque()
+        self._min_queue = deque()
+
+    def __len__(self):
+        return len(self.values)
+
+    def append(self, timestamp, value):
+        value = float(value)
+        self.trend = (value > self.last_value) - (value < self.last_value)
+        self.last_value = value
+        if self.first_time is None:
+            self.first_time = timestamp
+        if value > self.all_time_high:
+            self.all_time_high = value
+        if value < self.all_time_low:
+            self.all_time_low = value
+        index = self._count
+        self._count += 1
+        previous = self.values.last() if len(self.values) else None
+
+        self.times.append(timestamp)
+        evicted = self.values.append(value)
+        for aggregator in self.candles.values():
+            aggregator.add(timestamp, value)
+        self.stats.add(value, previous)
+        if evicted is not None:
+            self.stats.remove(evicted, self.values.first())
+            self._evictions += 1
+            # Kayan nokta birikimini önlemek için her tam turda pencere istatistiklerini yeniden hesapla
+            if self._evictions >= self.values.capacity:
+                self._evictions = 0
+                self.stats.reset(self.values.to_array())
+
+        while self._max_queue and self._max_queue[-1][1] <= value:
+            self._max_queue.pop()
+        self._max_queue.append((index, value))
+        while self._min_queue and self._min_queue[-1][1] >= value:
+            self._min_queue.pop()
+        self._min_queue.append((index, value))
+
+        oldest = self._count - len(self.values)
+        while self._max_queue[0][0] < oldest:
+            self._max_queue.popleft()
+        while self._min_queue[0][0] < oldest:
+            self._min_queue.popleft()
+
+    def extend(self, timestamps, values, state=None):
+        """Geçmiş tick'leri toplu yükle (ör. diskten okunan geçmiş).
+
+        `state` önceki oturumda kaydedilen mum durumudur (bkz. candle_state);
+        verilirse mumlar ondan kurulur ve yalnızca sonraki tick'ler işlenir.
+        Aksi halde her çözünürlüğe yalnızca tutabileceği son tick'ler verilir.
+        Diskteki eski tick'lere böylece hiç dokunulmaz.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        if len(self) or len(values) < 2:
+            for timestamp, value in zip(timestamps.tolist(), values.tolist()):
+                self.append(timestamp, value)
+            return
+
+        self.trend = int(np.sign(values[-1] - values[-2]))
+        self.stats.reset_ewma(values)
+        if state is not None:
+            # Kayıttan sonra gelen tick'ler
+            fresh = int(np.searchsorted(timestamps, float(state['last_time']), side='right'))
+            tail = values[fresh:]
+            self.first_time = float(state['first_time'])
+            self.all_time_high = float(state['all_time_high'])
+            self.all_time_low = float(state['all_time_low'])
+            if len(tail):
+                self.all_time_high = max(self.all_time_high, float(tail.max()))
+                self.all_time_low = min(self.all_time_low, float(tail.min()))
+        else:
+            self.first_time = float(timestamps[0])
+            self.all_time_high = float(values.max())
+            self.all_time_low = float(values.min())
+        for name, aggregator in self.candles.items():
+            if state is not None and float(state.get(f'{name}.resolution', 0)) == aggregator.resolution:
+                aggregator.restore({field: state[f'{name}.{field}'] for field in OHLC_FIELDS})
+                start = fresh
+            else:
+                start = int(np.searchsorted(timestamps, aggregator.window_start(timestamps[-1])))
+            aggregator.extend(timestamps[start:], values[start:])
+        capacity = self.values.capacity
+        timestamps, values = timestamps[-capacity:], values[-capacity:]
+        self.times.extend(timestamps)
+        self.values.extend(values)
+        self._count = len(values)
+        self.stats.reset(values)
+        self._evictions = 0
+        self.last_value = float(values[-1])
+
+        # Kendinden sonraki tüm değerlerden büyük (küçük) olanlar monoton kuyruğu oluşturur
+        after_max = np.append(np.maximum.accumulate(values[::-1])[::-1][1:], -np.inf)
+        after_min = np.append(np.minimum.accumulate(values[::-1])[::-1][1:], np.inf)
+        max_index = np.nonzero(values > after_max)[0]
+        min_index = np.nonzero(values < after_min)[0]
+        self._max_queue = deque(zip(max_index.tolist(), values[max_index].tolist()))
+        self._min_queue = deque(zip(min_index.tolist(), values[min_index].tolist()))
+
+    def candle_state(self):
+        """Mumların ve tüm geçmiş sınırlarının diske yazılabilir durumu; boşsa None."""
+        if not len(self):
+            return None
+        state = {'last_time': self.times.last(), 'first_time': self.first_time,
+                 'all_time_high': self.all_time_high, 'all_time_low': self.all_time_low}
+        for name, aggregator in self.candles.items():
+            state[f'{name}.resolution'] = aggregator.resolution
+            for field, data in aggregator.state().items():
+                state[f'{name}.{field}'] = data
+        return state
+
+    @property
+    def high(self):
+        return self._max_queue[0][1] if self._max_queue else 0.0
+
+    @property
+    def low(self):
+        return self._min_queue[0][1] if self._min_queue else 0.0
+
+    @property
+    def average(self):
+        return self.stats.mean if len(self.values) else 0.0
+
+    def first(self):
+        return self.values.first()
+
+    def latest(self):
+        return self.values.last()